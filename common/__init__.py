@@ -1,3 +1,3 @@
 from xxxt.core.app import App
 
-app = App()
+app = App(include_py3only=True)
@@ -0,0 +1,26 @@
+from xxxt.utils.forpy3only.mmrtutils import compr_traced_memory_delta, prepare_for_passing_without_kwargs
+
+SIZES = (100, 10000, 1000000)
+
+SLICES_COUNT = 10
+
+
+def slice_bytes(n: int) -> list:
+    data = b'\x00' * n
+    return [data[n // 4:3 * n // 4] for _ in range(SLICES_COUNT)]
+
+
+def slice_bytearray(n: int) -> list:
+    data = bytearray(n)
+    return [data[n // 4:3 * n // 4] for _ in range(SLICES_COUNT)]
+
+
+def slice_memoryview(n: int) -> list:
+    data = memoryview(b'\x00' * n)
+    return [data[n // 4:3 * n // 4] for _ in range(SLICES_COUNT)]
+
+
+for size in SIZES:
+    for slice_buffer in (slice_bytes, slice_bytearray, slice_memoryview):
+        print("{}({}):".format(slice_buffer.__name__, size))
+        compr_traced_memory_delta(prepare_for_passing_without_kwargs(slice_buffer, size))
@@ -0,0 +1,29 @@
+from xxxt.utils.common.spdtutils import TimeitDifferenceComputationModel
+
+SIZES = (100, 10000, 1000000)
+
+
+class BuffersTmtDiffCompMod(TimeitDifferenceComputationModel):
+    statements_executor = 'repeat'
+    times_to_repeat = 5
+    number = 10000
+
+
+buf_model = BuffersTmtDiffCompMod()
+
+for size in SIZES:
+    print("slicing a half of {} bytes:\n".format(size))
+
+    half_slice = '[{}:{}]'.format(size // 4, 3 * size // 4)
+
+    buf_model.first_statement = 'bts' + half_slice
+
+    buf_model.setup4first = "bts = b'\\x00' * {}".format(size)
+
+    buf_model.setup4second = 'barr = bytearray({})'.format(size)
+
+    buf_model.comprint(second_statement='barr' + half_slice)
+
+    buf_model.setup4second = "mv = memoryview(b'\\x00' * {})".format(size)
+
+    buf_model.comprint(second_statement='mv' + half_slice)
@@ -0,0 +1,24 @@
+from array import array
+from collections import deque
+
+from xxxt.utils.forpy3only.mmrtutils import compr_traced_memory_delta, prepare_for_passing_without_kwargs
+
+SIZES = (10, 1000, 100000)
+
+
+def create_list(n: int) -> list:
+    return list(range(1000, 1000 + n))
+
+
+def create_deque(n: int) -> deque:
+    return deque(range(1000, 1000 + n))
+
+
+def create_array(n: int) -> array:
+    return array('l', range(1000, 1000 + n))
+
+
+for size in SIZES:
+    for create in (create_list, create_deque, create_array):
+        print("{}({}):".format(create.__name__, size))
+        compr_traced_memory_delta(prepare_for_passing_without_kwargs(create, size))
@@ -0,0 +1,33 @@
+from xxxt.utils.common.spdtutils import TimeitDifferenceComputationModel
+
+SIZES = (10, 1000, 10000)
+
+
+class SequencesTmtDiffCompMod(TimeitDifferenceComputationModel):
+    statements_executor = 'repeat'
+    times_to_repeat = 5
+    number = 20000
+
+
+seq_model = SequencesTmtDiffCompMod()
+
+for size in SIZES:
+    print("sequences of {} ints:\n".format(size))
+
+    seq_model.setup4first = 'lst = list(range({}))'.format(size)
+
+    seq_model.setup4second = 'from collections import deque; dq = deque(range({}))'.format(size)
+
+    seq_model.comprint('lst.append(0); lst.pop()', 'dq.append(0); dq.pop()')
+
+    seq_model.comprint('lst.insert(0, 0); lst.pop(0)', 'dq.appendleft(0); dq.popleft()')
+
+    seq_model.comprint('lst[{}]'.format(size // 2), 'dq[{}]'.format(size // 2))
+
+    seq_model.setup4second = "from array import array; arr = array('l', range({}))".format(size)
+
+    seq_model.comprint('lst.append(0); lst.pop()', 'arr.append(0); arr.pop()')
+
+    seq_model.comprint('lst.insert(0, 0); lst.pop(0)', 'arr.insert(0, 0); arr.pop(0)')
+
+    seq_model.comprint('lst[{}]'.format(size // 2), 'arr[{}]'.format(size // 2))
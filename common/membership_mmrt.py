@@ -0,0 +1,17 @@
+from xxxt.utils.forpy3only.mmrtutils import compr_traced_memory_delta, prepare_for_passing_without_kwargs
+
+SIZES = (10, 1000, 100000)
+
+
+def create_set(n: int) -> set:
+    return set(range(1000, 1000 + n))
+
+
+def create_sorted_list(n: int) -> list:
+    return sorted(range(1000, 1000 + n))
+
+
+for size in SIZES:
+    for create in (create_set, create_sorted_list):
+        print("{}({}):".format(create.__name__, size))
+        compr_traced_memory_delta(prepare_for_passing_without_kwargs(create, size))
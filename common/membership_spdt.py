@@ -0,0 +1,24 @@
+from xxxt.utils.common.spdtutils import TimeitDifferenceComputationModel
+
+SIZES = (10, 1000, 100000)
+
+BISECT_STATEMENT = 'i = bisect_left(lst, {0}); i != len(lst) and lst[i] == {0}'
+
+
+class MembershipTmtDiffCompMod(TimeitDifferenceComputationModel):
+    statements_executor = 'repeat'
+    times_to_repeat = 5
+    number = 100000
+
+
+mbr_model = MembershipTmtDiffCompMod()
+
+for size in SIZES:
+    print("membership among {} even ints:\n".format(size))
+
+    mbr_model.setup4first = 's = set(range(0, {}, 2))'.format(2 * size)
+
+    mbr_model.setup4second = 'from bisect import bisect_left; lst = list(range(0, {}, 2))'.format(2 * size)
+
+    for value in (size, size + 1):
+        mbr_model.comprint('{} in s'.format(value), BISECT_STATEMENT.format(value))
@@ -0,0 +1,33 @@
+from collections import namedtuple
+
+from xxxt.utils.forpy3only.mmrtutils import compr_traced_memory_delta, prepare_for_passing_without_kwargs
+
+SIZES = (10, 1000, 100000)
+
+NamedPoint = namedtuple('NamedPoint', 'x y')
+
+
+class SlottedPoint:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def create_dicts(n: int) -> list:
+    return [{'x': i, 'y': i} for i in range(n)]
+
+
+def create_slotted_points(n: int) -> list:
+    return [SlottedPoint(i, i) for i in range(n)]
+
+
+def create_named_points(n: int) -> list:
+    return [NamedPoint(i, i) for i in range(n)]
+
+
+for size in SIZES:
+    for create in (create_dicts, create_slotted_points, create_named_points):
+        print("{}({}):".format(create.__name__, size))
+        compr_traced_memory_delta(prepare_for_passing_without_kwargs(create, size))
@@ -0,0 +1,53 @@
+from xxxt.utils.common.spdtutils import TimeitDifferenceComputationModel
+
+SIZES = (10, 1000, 10000)
+
+OPERATIONS_COUNT = 200000
+
+DICTS_SETUP = "rs = [{{'x': i, 'y': i}} for i in range({})]"
+
+SLOTS_SETUP = """
+class Point(object):
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+rs = [Point(i, i) for i in range({})]
+"""
+
+NAMEDTUPLES_SETUP = """
+from collections import namedtuple
+Point = namedtuple('Point', 'x y')
+rs = [Point(i, i) for i in range({})]
+"""
+
+
+class RecordsTmtDiffCompMod(TimeitDifferenceComputationModel):
+    statements_executor = 'repeat'
+    times_to_repeat = 5
+
+
+rec_model = RecordsTmtDiffCompMod()
+
+for size in SIZES:
+    print("{} records:\n".format(size))
+
+    rec_model.number = max(1, OPERATIONS_COUNT // size)
+
+    rec_model.setup4first = DICTS_SETUP.format(size)
+
+    rec_model.first_statement = "for r in rs: r['x']"
+
+    rec_model.setup4second = SLOTS_SETUP.format(size)
+
+    rec_model.comprint(second_statement='for r in rs: r.x')
+
+    rec_model.comprint("for r in rs: {'x': r['x'], 'y': r['y']}", 'for r in rs: Point(r.x, r.y)')
+
+    rec_model.setup4second = NAMEDTUPLES_SETUP.format(size)
+
+    rec_model.comprint(second_statement='for r in rs: r.x')
+
+    rec_model.comprint("for r in rs: {'x': r['x'], 'y': r['y']}", 'for r in rs: Point(r.x, r.y)')
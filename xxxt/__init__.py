@@ -1 +1 @@
-__all__ = ['core', 'utils', 'ngndemo', 'appdemo', ]
+__all__ = ['core', 'utils', 'ngndemo', 'appdemo', 'benchmarks', ]
@@ -0,0 +1,105 @@
+import argparse
+import json
+import os
+import sys
+from functools import partial
+
+from xxxt.core.app import App
+from xxxt.core.backends import EXECUTION_BACKENDS
+from xxxt.core.reporting import Record, iterate_executions_results, filter_stage, transform_stage, run_pipeline, \
+    write_sink
+
+OUTPUT_FORMATS = ('text', 'summary', 'json', )
+
+
+def format_summary_line(record: Record) -> str:
+    """
+    Formats a record as a single line with interpreter's executable name, xxxt file's name and execution status.
+
+    :param record: a tuple like (interpreter's executable name, xxxt file's name, xxxt file execution result).
+    :return: the formatted line.
+    """
+    interpreter_exec_name, xxxt_filename, xxxt_file_execution_result = record
+    return "{}\t{}\t{}\n".format(interpreter_exec_name, xxxt_filename, xxxt_file_execution_result['status'])
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """
+    Makes a parser of command line arguments.
+
+    :return: the parser.
+    """
+    parser = argparse.ArgumentParser(prog='python -m xxxt', description="Executes xxxt files of a directory.")
+    parser.add_argument('-C', '--directory', default=os.getcwd(), help="directory with xxxt files")
+    parser.add_argument('-n', '--name', dest='names', action='append', help="select a file by its exact name")
+    parser.add_argument('-g', '--glob', dest='globs', action='append', help="select files by a glob pattern")
+    parser.add_argument('-r', '--regex', dest='regexes', action='append', help="select files by a regular expression")
+    parser.add_argument('-i', '--interpreter', dest='interpreters', action='append',
+                        help="interpreter to execute files with, interpreters from settings are used by default")
+    parser.add_argument('-k', '--kind', choices=('spdt', 'mmrt', 'both'), default='both', help="kind of files")
+    parser.add_argument('-b', '--backend', choices=list(EXECUTION_BACKENDS), help="execution backend")
+    parser.add_argument('-j', '--jobs', type=int, help="degree of parallelism for the backend")
+    parser.add_argument('-t', '--timeout', type=float,
+                        help="seconds a warm worker may take to execute a file before it is re-executed serially")
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='text', help="output format")
+    parser.add_argument('--settings', default='settings.py', help="settings file within the directory")
+    parser.add_argument('--no-settings', action='store_true',
+                        help="don't load the settings file, which skips probing of interpreters")
+    parser.add_argument('-w', '--watch', action='store_true', help="re-run changed files until interrupted")
+    parser.add_argument('--interval', type=float, default=0.5, help="polling interval for the watch mode")
+    return parser
+
+
+def main(args=None) -> int:
+    """
+    Runs xxxt files selected by command line arguments.
+
+    :param args: a list of command line arguments, sys.argv is used if it is None.
+    :return: an exit status, 1 if any execution failed, 0 otherwise.
+    """
+    arguments = make_parser().parse_args(args)
+    directory = os.path.abspath(arguments.directory)
+    settings_filename = arguments.settings
+    if arguments.no_settings or not os.path.isfile(os.path.join(directory, settings_filename)):
+        settings_filename = None
+    app = App(include_py3only=arguments.kind != 'spdt', settings_filename=settings_filename)
+    app.apply_setting('CURRENT_WORKING_DIRECTORY', directory)
+    app.apply_setting('AVAILABLE_INTERPRETERS_EXECUTABLES_NAMES', arguments.interpreters)
+    app.apply_setting('EXECUTION_BACKEND', arguments.backend)
+    app.apply_setting('EXECUTION_PARALLELISM', arguments.jobs)
+    app.apply_setting('EXECUTION_TIMEOUT', arguments.timeout)
+    app.select(arguments.names, arguments.globs, arguments.regexes,
+               ('spdt', 'mmrt') if arguments.kind == 'both' else (arguments.kind, ))
+    if arguments.watch:
+        app.watch(arguments.interval)
+        return 0
+    if arguments.format != 'text':
+        app.apply_setting('PRINT_EXECUTION_RESULT_ON_CONSOLE', False)
+    app.run()
+    if arguments.format == 'summary':
+        run_pipeline(
+            iterate_executions_results(app.executions_results),
+            partial(filter_stage, predicate=lambda record: record[1] is not None),
+            partial(transform_stage, transformer=format_summary_line),
+            sink=write_sink
+        )
+    elif arguments.format == 'json':
+        json.dump({
+            interpreter_exec_name: {
+                xxxt_filename: dict(xxxt_file_execution_result, output=xxxt_file_execution_result['output'].decode(
+                    errors='replace'
+                ))
+                for xxxt_filename, xxxt_file_execution_result in xxxt_files_executions_results.items()
+            }
+            for interpreter_exec_name, xxxt_files_executions_results in app.executions_results.items()
+        }, sys.stdout, indent=4)
+        print()
+    return 0 if all(
+        xxxt_file_execution_result['status'] == 'SUCCESS'
+        for xxxt_files_executions_results in app.executions_results.values()
+        for xxxt_file_execution_result in xxxt_files_executions_results.values()
+    ) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import argparse
+import json
+import sys
+
+from xxxt.core.backends import EXECUTION_BACKENDS
+from xxxt.benchmarks.harness import DEFAULT_FILES_COUNTS, DEFAULT_BASELINES_FILENAME, benchmark, load_baselines, \
+    save_baselines, compare_with_baselines, format_results
+
+
+def main(args=None) -> int:
+    """
+    Runs the benchmark with command line arguments and compares results with baselines or stores them.
+
+    :param args: a list of command line arguments, sys.argv is used if it is None.
+    :return: an exit status, 1 if any regression was found, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog='python -m xxxt.benchmarks', description="Measures the harness's overhead.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_FILES_COUNTS),
+                        help="numbers of files in synthetic corpora")
+    parser.add_argument('--backends', nargs='+', choices=list(EXECUTION_BACKENDS), default=list(EXECUTION_BACKENDS),
+                        help="execution backends to measure")
+    parser.add_argument('--interpreter', default=sys.executable, help="interpreter which executes corpora")
+    parser.add_argument('--parallelism', type=int, default=None, help="degree of parallelism for backends")
+    parser.add_argument('--baselines', default=DEFAULT_BASELINES_FILENAME, help="JSON file with baselines")
+    parser.add_argument('--save-baselines', action='store_true', help="store results as new baselines")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed relative growth against baselines")
+    parser.add_argument('--json', action='store_true', help="output results as JSON")
+    arguments = parser.parse_args(args)
+    results = benchmark(arguments.sizes, arguments.backends, arguments.interpreter, arguments.parallelism)
+    print(json.dumps(results, indent=4) if arguments.json else format_results(results))
+    if arguments.save_baselines:
+        save_baselines(results, arguments.baselines)
+        return 0
+    regressions = compare_with_baselines(results, load_baselines(arguments.baselines), arguments.tolerance)
+    for regression in regressions:
+        print("REGRESSION: {}".format(regression), file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
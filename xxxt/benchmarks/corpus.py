@@ -0,0 +1,40 @@
+import os
+from typing import List
+
+SPDT_FILE_CONTENT = "print(sum(range(10)))\n"
+
+MMRT_FILE_CONTENT = """import tracemalloc
+
+tracemalloc.start()
+data = [i for i in range(10)]
+print(tracemalloc.get_traced_memory()[0] > 0)
+tracemalloc.stop()
+"""
+
+
+def generate_corpus(directory: str, files_count: int, mmrt_files_ratio: float = 0.5) -> List[str]:
+    """
+    Generates a synthetic corpus of trivial spdt and mmrt files in a directory.
+
+    :param directory: the directory in which the files will be created, it must exist.
+    :param files_count: a total number of files to be created.
+    :param mmrt_files_ratio: a part of files which will be mmrt files.
+    :return: a list of created files names.
+    """
+    if not isinstance(directory, str):
+        raise TypeError("directory argument must be a string, not {}".format(directory.__class__.__name__))
+    if not isinstance(files_count, int):
+        raise TypeError("files_count must be an integer, not {}".format(files_count.__class__.__name__))
+    if files_count < 0:
+        raise ValueError("files_count's value can't be negative")
+    if not 0 <= mmrt_files_ratio <= 1:
+        raise ValueError("mmrt_files_ratio's value must be between 0 and 1")
+    mmrt_files_count = int(files_count * mmrt_files_ratio)
+    files_names = []
+    for index in range(files_count):
+        is_mmrt_file = index < mmrt_files_count
+        file_name = 'synthetic{:05d}_{}.py'.format(index, 'mmrt' if is_mmrt_file else 'spdt')
+        with open(os.path.join(directory, file_name), 'w') as xxxt_file:
+            xxxt_file.write(MMRT_FILE_CONTENT if is_mmrt_file else SPDT_FILE_CONTENT)
+        files_names.append(file_name)
+    return files_names
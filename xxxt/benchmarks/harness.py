@@ -0,0 +1,229 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Union, Tuple
+
+import xxxt.core.app
+import xxxt.core.engine
+import xxxt.core.ngnpartls
+import xxxt.core.reporting
+from xxxt.core.backends import EXECUTION_BACKENDS
+from xxxt.benchmarks.corpus import generate_corpus
+
+DEFAULT_FILES_COUNTS = (10, 100, 1000, )
+
+DEFAULT_BASELINES_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+
+def measure(phase: Callable[[], Any], files_count: int) -> Tuple[Dict[str, float], Any]:
+    """
+    Calls a phase once and measures its duration, its throughput and a peak of memory allocated by the harness.
+    Memory of child processes is not included. The peak is None if the phase itself stopped tracemalloc,
+    which happens when mmrt files are executed in-process.
+
+    :param phase: a callable like () -> any which performs the measured phase.
+    :param files_count: a number of files processed by the phase.
+    :return: a tuple with a dictionary of measurements and phase's call result.
+    """
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    phase_result = phase()
+    seconds = time.perf_counter() - start_time
+    peak_memory = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+    tracemalloc.stop()
+    return {
+        'seconds': seconds,
+        'files_per_second': files_count / seconds if seconds else float('inf'),
+        'peak_memory': peak_memory,
+    }, phase_result
+
+
+def benchmark_corpus(
+        files_count: int,
+        backends: Union[Tuple[str], List[str]] = tuple(EXECUTION_BACKENDS),
+        interpreter_exec_name: str = sys.executable,
+        parallelism: int = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Generates a synthetic corpus in a temporary directory and measures each phase of the engine on it:
+    settings handling, discovery, a whole App's run with the first of backends and its time to first result,
+    which is left out if the run produced no results, execution with each of backends and processing of results.
+    The App's run is measured before the backends, so its peak memory doesn't depend on which of them ran earlier
+    and imported modules in the same process.
+
+    :param files_count: a number of files in the corpus.
+    :param backends: names of execution backends to measure.
+    :param interpreter_exec_name: interpreter's executable name which executes the corpus.
+    :param parallelism: a degree of parallelism for backends, the engine's setting is used if it is None.
+    :return: a dictionary which maps each phase's name to its measurements.
+    """
+    for backend in backends:
+        if backend not in EXECUTION_BACKENDS:
+            raise ValueError("backend's value must be one of {}".format(', '.join(EXECUTION_BACKENDS)))
+    measurements = {}
+    with tempfile.TemporaryDirectory(prefix='xxxt-bench-') as directory:
+        generate_corpus(directory, files_count)
+        measurements['settings'], _ = measure(
+            lambda: [xxxt.core.engine.settings() for _ in range(files_count)], files_count
+        )
+        measurements['discovery'], (xxxt_files, xxxt_files_for_py3impls) = measure(
+            lambda: (
+                xxxt.core.engine.explore_dir_for_files(directory),
+                xxxt.core.ngnpartls.explore_dir_py3impls(directory)
+            ),
+            files_count
+        )
+        if backends:
+            with open(os.path.join(directory, 'settings.py'), 'w') as settings_file:
+                settings_file.write("AVAILABLE_INTERPRETERS_EXECUTABLES_NAMES = [{!r}]\n".format(interpreter_exec_name))
+            app = xxxt.core.app.App(include_py3only=True)
+            app.apply_setting('CURRENT_WORKING_DIRECTORY', directory)
+            app.apply_setting('PRINT_EXECUTION_RESULT_ON_CONSOLE', False)
+            app.apply_setting('EXECUTION_BACKEND', backends[0])
+            app.apply_setting('EXECUTION_PARALLELISM', parallelism)
+            measurements['app:' + backends[0]], _ = measure(app.run, files_count)
+            if app.time_to_first_result is not None:
+                measurements['app:' + backends[0] + ':first_result'] = {
+                    'seconds': app.time_to_first_result,
+                    'files_per_second': None,
+                    'peak_memory': None,
+                }
+        executions_results = None
+        for backend in backends:
+            measurements['execution:' + backend], executions_results = measure(
+                lambda: (
+                    xxxt.core.engine.execute_all_for_all(
+                        xxxt_files, [interpreter_exec_name], backend=backend, parallelism=parallelism,
+                        directory=directory
+                    ),
+                    xxxt.core.ngnpartls.execute_all_for_py3impls(
+                        xxxt_files_for_py3impls, [interpreter_exec_name], backend=backend, parallelism=parallelism,
+                        directory=directory
+                    )
+                ),
+                files_count
+            )
+        if executions_results is not None:
+            measurements['processing'], _ = measure(
+                lambda: [
+                    xxxt.core.reporting.report(results, stream=io.StringIO()) for results in executions_results
+                ],
+                files_count
+            )
+    return measurements
+
+
+def benchmark(
+        files_counts: Union[Tuple[int], List[int]] = DEFAULT_FILES_COUNTS,
+        backends: Union[Tuple[str], List[str]] = tuple(EXECUTION_BACKENDS),
+        interpreter_exec_name: str = sys.executable,
+        parallelism: int = None
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Runs benchmark_corpus for each corpus size.
+
+    :param files_counts: sizes of corpora.
+    :param backends: names of execution backends to measure.
+    :param interpreter_exec_name: interpreter's executable name which executes corpora.
+    :param parallelism: a degree of parallelism for backends, the engine's setting is used if it is None.
+    :return: a dictionary which maps each corpus size as a string to measurements of its phases.
+    """
+    if not isinstance(files_counts, (tuple, list)):
+        raise TypeError("files_counts argument must be a tuple of integers or a list of integers, not {}".format(
+            files_counts.__class__.__name__
+        ))
+    return {
+        str(files_count): benchmark_corpus(files_count, backends, interpreter_exec_name, parallelism)
+        for files_count in files_counts
+    }
+
+
+def load_baselines(filename: str = DEFAULT_BASELINES_FILENAME) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Loads stored baselines.
+
+    :param filename: a name of the JSON file with baselines.
+    :return: the baselines or an empty dictionary if the file doesn't exist.
+    """
+    if not os.path.exists(filename):
+        return {}
+    with open(filename) as baselines_file:
+        return json.load(baselines_file)
+
+
+def save_baselines(
+        results: Dict[str, Dict[str, Dict[str, float]]],
+        filename: str = DEFAULT_BASELINES_FILENAME
+) -> None:
+    """
+    Stores benchmark's results as baselines, results for sizes which are already stored are replaced.
+
+    :param results: benchmark's results.
+    :param filename: a name of the JSON file with baselines.
+    :return: None.
+    """
+    baselines = load_baselines(filename)
+    baselines.update(results)
+    with open(filename, 'w') as baselines_file:
+        json.dump(baselines, baselines_file, indent=4, sort_keys=True)
+
+
+def compare_with_baselines(
+        results: Dict[str, Dict[str, Dict[str, float]]],
+        baselines: Dict[str, Dict[str, Dict[str, float]]],
+        tolerance: float = 0.25,
+        min_seconds: float = 0.01
+) -> List[str]:
+    """
+    Finds phases which became slower or hungrier for memory than their baselines by more than a tolerance.
+    Durations below min_seconds are too noisy to be compared and are skipped, as are missing (None) measurements.
+
+    :param results: benchmark's results.
+    :param baselines: stored baselines.
+    :param tolerance: an allowed relative growth, 0.25 means 25%.
+    :param min_seconds: a minimal duration which is compared.
+    :return: a list of regressions descriptions.
+    """
+    if tolerance < 0:
+        raise ValueError("tolerance's value can't be negative")
+    regressions = []
+    for files_count, phases in results.items():
+        for phase_name, measurements in phases.items():
+            baseline = baselines.get(files_count, {}).get(phase_name)
+            if baseline is None:
+                continue
+            if measurements['seconds'] is not None and baseline['seconds'] is not None and \
+                    max(measurements['seconds'], baseline['seconds']) >= min_seconds and \
+                    measurements['seconds'] > baseline['seconds'] * (1 + tolerance):
+                regressions.append("{} files, {}: {:.4f}s against baseline {:.4f}s".format(
+                    files_count, phase_name, measurements['seconds'], baseline['seconds']
+                ))
+            if measurements['peak_memory'] is not None and baseline['peak_memory'] is not None and \
+                    measurements['peak_memory'] > baseline['peak_memory'] * (1 + tolerance):
+                regressions.append("{} files, {}: peak memory {} B against baseline {} B".format(
+                    files_count, phase_name, measurements['peak_memory'], baseline['peak_memory']
+                ))
+    return regressions
+
+
+def format_results(results: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+    """
+    Formats benchmark's results as a table.
+
+    :param results: benchmark's results.
+    :return: the formatted table.
+    """
+    lines = ["{:>6} {:<28} {:>12} {:>14} {:>14}".format('files', 'phase', 'seconds', 'files/sec', 'peak memory')]
+    for files_count, phases in results.items():
+        for phase_name, measurements in phases.items():
+            lines.append("{:>6} {:<28} {:>12.4f} {:>14.1f} {:>14}".format(
+                files_count, phase_name,
+                float('nan') if measurements['seconds'] is None else measurements['seconds'],
+                float('nan') if measurements['files_per_second'] is None else measurements['files_per_second'],
+                'n/a' if measurements['peak_memory'] is None else "{} B".format(measurements['peak_memory'])
+            ))
+    return "\n".join(lines)
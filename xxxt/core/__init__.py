@@ -1 +1 @@
-__all__ = ['engine', 'ngnpartls', 'app', 'utilities', ]
+__all__ = ['engine', 'ngnpartls', 'app', 'utilities', 'reporting', 'backends', 'worker', ]
@@ -1,27 +1,64 @@
-from typing import Any
+import time
+from collections import deque
+from functools import partial
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
 
 import xxxt.core.engine
 import xxxt.core.ngnpartls
+import xxxt.core.reporting
 import xxxt.core.utilities
 
 
 class App:
     """
     Class that represents a xxxt app.
+    Construction is cheap: the settings file is loaded, interpreters are probed by it and the directory is explored
+    only on first use, and xxxt files are executed only by run.
     
     """
-    def __init__(self, include_py3only=False):
+    def __init__(self, include_py3only=False, settings_filename='settings.py'):
         """
         Initializes App instances.
         
         :param include_py3only: a boolean flag that indicates to include or not python3 only executions.
+        :param settings_filename: the name of the settings file in the directory, None means not to load any.
         """
-        xxxt.core.engine.populate_settings_with_file()
-        self._settings = xxxt.core.engine.settings()
-        self._settings['XXXT_FILES'] = xxxt.core.engine.explore_dir_for_files()
+        if settings_filename is not None and not isinstance(settings_filename, str):
+            raise TypeError("settings_filename argument must be a string, not {}".format(
+                settings_filename.__class__.__name__
+            ))
         self._include_py3only = include_py3only
-        if self._include_py3only:
-            self._settings['XXXT_FILES_FOR_PY3IMPLS'] = xxxt.core.ngnpartls.execute_all_for_py3impls()
+        self._settings_filename = settings_filename
+        self._selection = (None, None, None)
+        self._kinds = ('spdt', 'mmrt', )
+        self._settings_overrides = {}
+        self._settings_file_values = None
+        self._settings = None
+        self._xxxt_files = None
+        self._executions_results = {}
+        self.time_to_first_result = None
+        self._run_started_at = None
+
+    @property
+    def settings(self) -> Mapping[str, Any]:
+        """
+        An immutable snapshot of app's settings: engine's settings, values from the settings file on top of them
+        and applied app's settings on top of both. The settings file is read on the first access
+        and its values are kept by the app, so engine's settings aren't changed.
+
+        :return: the immutable snapshot of app's settings.
+        """
+        if self._settings is None:
+            if self._settings_file_values is None:
+                self._settings_file_values = {} if self._settings_filename is None else \
+                    xxxt.core.engine.read_settings_file(
+                        self._settings_filename, self._settings_overrides.get('CURRENT_WORKING_DIRECTORY')
+                    )
+            settings = dict(xxxt.core.engine.settings())
+            settings.update(self._settings_file_values)
+            settings.update(self._settings_overrides)
+            self._settings = xxxt.core.engine.freeze(settings)
+        return self._settings
 
     def apply_setting(self, name: str, value: Any) -> bool:
         """
@@ -31,37 +68,243 @@ class App:
         :param value: setting's value, can be of any type.
         :return: True if setting was applied, False otherwise.
         """
-        return xxxt.core.engine.set_setting(name, value, self._settings)
+        if name not in xxxt.core.engine.settings() or value is None or value == '':
+            return False
+        self._settings_overrides[name] = value
+        if name == 'CURRENT_WORKING_DIRECTORY':
+            self._settings_file_values = None
+        self._settings = None
+        self._xxxt_files = None
+        return True
+
+    def select(self, names: List[str] = None, globs: List[str] = None, regexes: List[str] = None,
+               kinds: List[str] = ('spdt', 'mmrt', )) -> None:
+        """
+        Restricts xxxt files which the app executes, see select_files from xxxt.core.engine.
+        mmrt files are executed only if the app includes python3 only executions.
+
+        :param names: a list of exact files names.
+        :param globs: a list of glob patterns.
+        :param regexes: a list of regular expressions.
+        :param kinds: a list with 'spdt', 'mmrt' or both of them.
+        :return: None.
+        """
+        if not isinstance(kinds, (tuple, list)):
+            raise TypeError("kinds argument must be a tuple of strings or a list of strings, not {}".format(
+                kinds.__class__.__name__
+            ))
+        if any(kind not in ('spdt', 'mmrt') for kind in kinds):
+            raise ValueError("kinds' values must be 'spdt' or 'mmrt'")
+        self._selection = (names, globs, regexes)
+        self._kinds = tuple(kinds)
+        self._xxxt_files = None
+
+    @property
+    def executions_results(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Executions results for each interpreter from the last run, updated by watch.
+
+        :return: a dictionary with data of executions results for each interpreter.
+        """
+        return self._executions_results
 
     def run(self) -> None:
         """
-        Run the app by calling execute_all_for_all function from xxxt.core 
-        and 
-        if PRINT_EXECUTION_RESULT_ON_CONSOLE setting is True outputs execution result on console.
+        Run the app by executing all xxxt files for all interpreters with one call of iterate_executions function
+        from xxxt.core, so parallel and warm backends run across interpreters,
+        and if PRINT_EXECUTION_RESULT_ON_CONSOLE setting is True outputs each execution result on console
+        as soon as it is ready, labeled with its interpreter, followed by a time to first result.
+        The time to first result includes the lazy startup and is also stored in time_to_first_result attribute.
 
         :return: None.
         """
-        executions_results = xxxt.core.engine.execute_all_for_all(self._settings['XXXT_FILES'])
-        executions_results_for_py3impls = None
-        if self._include_py3only:
-            executions_results_for_py3impls = xxxt.core.ngnpartls.execute_all_for_py3impls(
-                self._settings['XXXT_FILES_FOR_PY3IMPLS']
+        self._run_started_at = time.perf_counter()
+        self.time_to_first_result = None
+        self._executions_results = {}
+        if self._xxxt_files is None:
+            self._xxxt_files = self._explore_dir()
+        records = map(self._store_execution_result, self._iterate_executions(self._make_pairs(*self._xxxt_files)))
+        if self.settings['PRINT_EXECUTION_RESULT_ON_CONSOLE']:
+            xxxt.core.reporting.run_pipeline(
+                records, xxxt.core.reporting.format_labeled_stage,
+                sink=partial(xxxt.core.reporting.write_sink, buffer_size=0)
             )
-        if self._settings['PRINT_EXECUTION_RESULT_ON_CONSOLE']:
-            xxxt.core.engine.process_all_for_all(
-                executions_results,
-                xxxt.core.utilities.print_interpreter_exec_name_callback,
-                xxxt.core.utilities.print_xxxt_filename_callback,
-                xxxt.core.utilities.print_callback,
-                xxxt.core.utilities.process_none_results_callback,
-                xxxt.core.utilities.process_none_results_callback
-            )
-            if executions_results_for_py3impls is not None:
-                xxxt.core.engine.process_all_for_all(
-                    executions_results,
-                    xxxt.core.utilities.print_interpreter_exec_name_callback,
-                    xxxt.core.utilities.print_xxxt_filename_callback,
-                    xxxt.core.utilities.print_callback,
-                    xxxt.core.utilities.process_none_results_callback,
-                    xxxt.core.utilities.process_none_results_callback
+            if self.time_to_first_result is not None:
+                print("time to first result: {:.3f}s".format(self.time_to_first_result))
+        else:
+            deque(records, maxlen=0)
+
+    def watch(self, interval: float = 0.5, debounce: float = 0.3, iterations: int = None) -> None:
+        """
+        Runs the app and then polls the directory for changed xxxt files.
+        On each change re-executes only the changed files for interpreters that are affected by them
+        and, if PRINT_EXECUTION_RESULT_ON_CONSOLE setting is True, outputs only the delta against previous results.
+        Bursts of saves are collapsed into one re-execution: the files have to stay unchanged for debounce seconds.
+        Stops on KeyboardInterrupt or after a given number of polling iterations.
+
+        :param interval: seconds between two polls of the directory.
+        :param debounce: seconds during which changed files must stay unchanged before a re-execution.
+        :param iterations: a number of polling iterations after which watching stops, None means watch forever.
+        :return: None.
+        """
+        if not isinstance(interval, (int, float)) or not isinstance(debounce, (int, float)):
+            raise TypeError("interval and debounce arguments must be numbers")
+        if interval <= 0 or debounce < 0:
+            raise ValueError("interval's value must be greater then 0 and debounce's value can't be negative")
+        if iterations is not None and not isinstance(iterations, int):
+            raise TypeError("iterations argument must be an integer, not {}".format(iterations.__class__.__name__))
+        self.run()
+        directory = self.settings['CURRENT_WORKING_DIRECTORY']
+        files_states = xxxt.core.engine.compute_files_states(self._discover_files(), directory)
+        try:
+            while iterations is None or iterations > 0:
+                if iterations is not None:
+                    iterations -= 1
+                time.sleep(interval)
+                current_states = xxxt.core.engine.compute_files_states(self._discover_files(), directory, files_states)
+                changed_files, removed_files = xxxt.core.engine.detect_changed_files(files_states, current_states)
+                if not changed_files and not removed_files:
+                    continue
+                while True:
+                    time.sleep(debounce)
+                    settled_states = xxxt.core.engine.compute_files_states(
+                        self._discover_files(), directory, current_states
+                    )
+                    if settled_states == current_states:
+                        break
+                    current_states = settled_states
+                changed_files, removed_files = xxxt.core.engine.detect_changed_files(files_states, current_states)
+                files_states = current_states
+                self._rerun(changed_files, removed_files)
+        except KeyboardInterrupt:
+            pass
+
+    def _explore_dir(self) -> Tuple[List[str], List[str]]:
+        """
+        Explores the directory for xxxt files which the app executes.
+
+        :return: a tuple with a list of xxxt files and a list of xxxt files for python3 implementations.
+        """
+        directory = self.settings['CURRENT_WORKING_DIRECTORY']
+        return (
+            xxxt.core.engine.select_files(
+                xxxt.core.engine.explore_dir_for_files(directory, False, self.settings['XXXT_FILES_NAMES_SUFFIXES']),
+                *self._selection
+            ) if 'spdt' in self._kinds else [],
+            xxxt.core.engine.select_files(
+                xxxt.core.ngnpartls.explore_dir_py3impls(directory), *self._selection
+            ) if self._include_py3only and 'mmrt' in self._kinds else []
+        )
+
+    def _discover_files(self) -> List[str]:
+        """
+        Explores the directory for all xxxt files which the app executes.
+
+        :return: a list of found files.
+        """
+        xxxt_files, xxxt_files_for_py3impls = self._explore_dir()
+        return xxxt_files + xxxt_files_for_py3impls
+
+    def _make_pairs(self, xxxt_files: List[str],
+                    xxxt_files_for_py3impls: List[str] = ()) -> List[Tuple[str, str]]:
+        """
+        Makes pairs of interpreters and xxxt files which the app executes,
+        xxxt files for python3 implementations are paired only with interpreters of third python.
+
+        :param xxxt_files: a list with xxxt filenames.
+        :param xxxt_files_for_py3impls: a list with xxxt filenames for python3 implementations.
+        :return: a list of tuples like (interpreter's executable name, xxxt file's name).
+        """
+        interpreters_execs_names = self.settings['AVAILABLE_INTERPRETERS_EXECUTABLES_NAMES']
+        return [
+            (interpreter_exec_name, xxxt_filename)
+            for interpreter_exec_name in interpreters_execs_names
+            for xxxt_filename in xxxt_files
+        ] + [
+            (interpreter_exec_name, xxxt_filename)
+            for interpreter_exec_name in interpreters_execs_names if interpreter_exec_name.find('3') != -1
+            for xxxt_filename in xxxt_files_for_py3impls
+        ]
+
+    def _iterate_executions(self, pairs: List[Tuple[str, str]]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Executes pairs of interpreters and xxxt files with app's settings.
+
+        :param pairs: a list of tuples like (interpreter's executable name, xxxt file's name).
+        :return: an iterator of tuples like (interpreter's executable name, xxxt file's name, xxxt file execution result)
+        in order of completion.
+        """
+        return xxxt.core.engine.iterate_executions(
+            pairs,
+            self.settings['XXXT_FILES_NAMES_SUFFIXES'] +
+            self.settings['XXXT_FILES_NAMES_SUFFIXES_ONLY_FOR_THIRD_PYTHON_IMPLEMENTATIONS'],
+            self.settings['EXECUTION_BACKEND'], self.settings['EXECUTION_PARALLELISM'],
+            self.settings['CURRENT_WORKING_DIRECTORY'], self.settings['EXECUTION_TIMEOUT']
+        )
+
+    def _store_execution_result(
+            self, record: Tuple[str, str, Dict[str, Any]]
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Stores an execution result of a record into results stored by the app
+        and, for the first record of a run, stores the time to first result.
+
+        :param record: a tuple like (interpreter's executable name, xxxt file's name, xxxt file execution result).
+        :return: the record.
+        """
+        if self.time_to_first_result is None:
+            self.time_to_first_result = time.perf_counter() - self._run_started_at
+        interpreter_exec_name, xxxt_filename, xxxt_file_execution_result = record
+        self._executions_results.setdefault(interpreter_exec_name, {})[xxxt_filename] = xxxt_file_execution_result
+        return record
+
+    def _merge_executions_results(self, executions_results: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        """
+        Merges executions results for each interpreter into results stored by the app.
+
+        :param executions_results: a dictionary with data of executions results for each interpreter.
+        :return: None.
+        """
+        for interpreter_exec_name, xxxt_files_executions_results in executions_results.items():
+            self._executions_results.setdefault(interpreter_exec_name, {}).update(xxxt_files_executions_results)
+
+    def _rerun(self, changed_files: List[str], removed_files: List[str]) -> None:
+        """
+        Re-executes changed xxxt files only for affected interpreters, forgets removed ones
+        and outputs the delta against previous results.
+
+        :param changed_files: a list of changed or added xxxt files.
+        :param removed_files: a list of removed xxxt files.
+        :return: None.
+        """
+        self._xxxt_files = self._explore_dir()
+        py3impls_files = self._xxxt_files[1]
+        changed_py3impls_files = [xxxt_file for xxxt_file in changed_files if xxxt_file in py3impls_files]
+        changed_files = [xxxt_file for xxxt_file in changed_files if xxxt_file not in changed_py3impls_files]
+        previous_results = {
+            interpreter_exec_name: dict(xxxt_files_executions_results)
+            for interpreter_exec_name, xxxt_files_executions_results in self._executions_results.items()
+        }
+        for xxxt_files_executions_results in self._executions_results.values():
+            for xxxt_filename in removed_files:
+                xxxt_files_executions_results.pop(xxxt_filename, None)
+        executions_results = {}
+        for interpreter_exec_name, xxxt_filename, xxxt_file_execution_result in self._iterate_executions(
+                self._make_pairs(changed_files, changed_py3impls_files)
+        ):
+            executions_results.setdefault(interpreter_exec_name, {})[xxxt_filename] = xxxt_file_execution_result
+        self._merge_executions_results(executions_results)
+        if not self.settings['PRINT_EXECUTION_RESULT_ON_CONSOLE']:
+            return
+        for interpreter_exec_name, xxxt_files_executions_results in previous_results.items():
+            for xxxt_filename in removed_files:
+                if xxxt_filename in xxxt_files_executions_results:
+                    xxxt.core.utilities.print_delta_callback(
+                        interpreter_exec_name, xxxt_filename, xxxt_files_executions_results[xxxt_filename], None
+                    )
+        for interpreter_exec_name, xxxt_files_executions_results in executions_results.items():
+            for xxxt_filename, execution_result in xxxt_files_executions_results.items():
+                xxxt.core.utilities.print_delta_callback(
+                    interpreter_exec_name, xxxt_filename,
+                    previous_results.get(interpreter_exec_name, {}).get(xxxt_filename), execution_result
                 )
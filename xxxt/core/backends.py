@@ -0,0 +1,255 @@
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Union, Tuple, List, Any, Dict, Iterator
+
+import xxxt.core.worker
+from xxxt.core.engine import execute, check_execution_arguments, settings
+
+Pair = Tuple[str, str]
+
+
+def execute_serially(
+        pairs: List[Pair],
+        files_names_suffixes: Union[Tuple[str], List[str]] = None,
+        parallelism: int = None,
+        directory: str = None,
+        timeout: float = None
+) -> Iterator[Tuple[Pair, Dict[str, Any]]]:
+    """
+    Executes each xxxt file with its interpreter one after another in a new process.
+
+    :param pairs: a list of tuples like (interpreter's executable name, xxxt file's name).
+    :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param parallelism: ignored, accepted for a compatibility with other backends.
+    :param directory: the directory in which files are executed, the engine's setting is used if it is None.
+    :param timeout: ignored, accepted for a compatibility with other backends.
+    :return: an iterator of tuples like (pair, a result of its execution) in order of completion.
+    """
+    for pair in pairs:
+        yield pair, execute(pair[1], pair[0], files_names_suffixes, directory)
+
+
+def execute_in_parallel(
+        pairs: List[Pair],
+        files_names_suffixes: Union[Tuple[str], List[str]] = None,
+        parallelism: int = None,
+        directory: str = None,
+        timeout: float = None
+) -> Iterator[Tuple[Pair, Dict[str, Any]]]:
+    """
+    Executes xxxt files with their interpreters in new processes, up to parallelism processes at a time.
+
+    :param pairs: a list of tuples like (interpreter's executable name, xxxt file's name).
+    :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param parallelism: a maximal number of simultaneously running processes.
+    :param directory: the directory in which files are executed, the engine's setting is used if it is None.
+    :param timeout: ignored, accepted for a compatibility with other backends.
+    :return: an iterator of tuples like (pair, a result of its execution) in order of completion.
+    """
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        futures = {
+            executor.submit(execute, pair[1], pair[0], files_names_suffixes, directory): pair for pair in pairs
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def execute_with_warm_workers(
+        pairs: List[Pair],
+        files_names_suffixes: Union[Tuple[str], List[str]] = None,
+        parallelism: int = None,
+        directory: str = None,
+        timeout: float = None
+) -> Iterator[Tuple[Pair, Dict[str, Any]]]:
+    """
+    Executes xxxt files inside long-living worker processes, up to parallelism workers for each interpreter.
+    A worker pays interpreter's startup and common imports only once, so modules imported by xxxt files are shared
+    between executions. If a worker can't be started, dies or doesn't respond within timeout seconds,
+    it is killed and the file is executed by execute_serially. A result of such re-execution has a 'fallback' key
+    with its reason, so the doubled cost is visible.
+
+    :param pairs: a list of tuples like (interpreter's executable name, xxxt file's name).
+    :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param parallelism: a maximal number of workers for each interpreter.
+    :param directory: the directory in which files are executed, the engine's setting is used if it is None.
+    :param timeout: seconds to wait for a worker's response, None means to wait without limit.
+    :return: an iterator of tuples like (pair, a result of its execution) in order of completion.
+    """
+    if directory is None:
+        directory = settings()['CURRENT_WORKING_DIRECTORY']
+    for interpreter_exec_name, xxxt_filename in pairs:
+        check_execution_arguments(xxxt_filename, interpreter_exec_name, files_names_suffixes)
+    pairs_queues = {}
+    for pair in pairs:
+        pairs_queues.setdefault(pair[0], queue.Queue()).put(pair)
+    results = queue.Queue()
+    threads = [
+        threading.Thread(target=_serve_pairs_queue, args=(
+            pairs_queue, files_names_suffixes, directory, timeout, results
+        ))
+        for pairs_queue in pairs_queues.values()
+        for _ in range(min(parallelism or 1, pairs_queue.qsize()))
+    ]
+    for thread in threads:
+        thread.start()
+    running_threads_count = len(threads)
+    while running_threads_count:
+        result = results.get()
+        if result is None:
+            running_threads_count -= 1
+        else:
+            yield result
+    for thread in threads:
+        thread.join()
+
+
+def _serve_pairs_queue(
+        pairs_queue: queue.Queue,
+        files_names_suffixes: Union[Tuple[str], List[str]],
+        directory: str,
+        timeout: Union[float, None],
+        results: queue.Queue
+) -> None:
+    """
+    Starts one worker process and feeds it with pairs from a queue until the queue is empty.
+    Each result is put into a results queue as a tuple like (pair, result) as soon as it is ready,
+    None is put when the worker is done.
+
+    :param pairs_queue: a queue of pairs which share the same interpreter.
+    :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param directory: the directory in which files are executed.
+    :param timeout: seconds to wait for a worker's response, None means to wait without limit.
+    :param results: a queue into which results are put.
+    :return: None.
+    """
+    worker_process, responses = None, None
+    try:
+        while True:
+            try:
+                pair = pairs_queue.get_nowait()
+            except queue.Empty:
+                break
+            if worker_process is None or worker_process.poll() is not None:
+                worker_process, responses = _start_worker(pair[0])
+            response = None
+            fallback = None
+            if worker_process is not None:
+                fallback = 'warm worker exited'
+                try:
+                    worker_process.stdin.write(json.dumps({'filename': pair[1], 'directory': directory}) + '\n')
+                    worker_process.stdin.flush()
+                    response = responses.get(timeout=timeout)
+                except (BrokenPipeError, OSError):
+                    pass
+                except queue.Empty:
+                    fallback = 'warm worker timed out after {}s'.format(timeout)
+                    worker_process.kill()
+                    worker_process.wait()
+            if response:
+                response = json.loads(response)
+                results.put((pair, {'status': response['status'], 'output': response['output'].encode()}))
+            else:
+                for pair, execution_result in execute_serially([pair], files_names_suffixes, directory=directory):
+                    if fallback is not None:
+                        execution_result = {
+                            'status': execution_result['status'],
+                            'fallback': "re-executed serially, {}".format(fallback),
+                            'output': execution_result['output'],
+                        }
+                    results.put((pair, execution_result))
+                worker_process = None
+    finally:
+        if worker_process is not None:
+            worker_process.stdin.close()
+            worker_process.wait()
+        results.put(None)
+
+
+def _start_worker(interpreter_exec_name: str) -> Tuple[Union[subprocess.Popen, None], Union[queue.Queue, None]]:
+    """
+    Starts a warm worker process for an interpreter and a daemon thread which reads its responses into a queue,
+    so a response can be awaited with a timeout. An empty string is put into the queue when the worker exits.
+
+    :param interpreter_exec_name: interpreter's executable name.
+    :return: a tuple with the worker process and the queue of its responses or (None, None)
+    if the interpreter's executable was not found.
+    """
+    try:
+        worker_process = subprocess.Popen(
+            (interpreter_exec_name, xxxt.core.worker.__file__),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True
+        )
+    except FileNotFoundError:
+        return None, None
+    responses = queue.Queue()
+
+    def read_responses() -> None:
+        for line in iter(worker_process.stdout.readline, ''):
+            responses.put(line)
+        responses.put('')
+
+    threading.Thread(target=read_responses, daemon=True).start()
+    return worker_process, responses
+
+
+@lru_cache(maxsize=None)
+def is_current_interpreter(interpreter_exec_name: str) -> bool:
+    """
+    Checks if an interpreter's executable is the one which runs the current process.
+
+    :param interpreter_exec_name: interpreter's executable name.
+    :return: True if it is, False otherwise.
+    """
+    try:
+        completed_process = subprocess.run(
+            (interpreter_exec_name, '-c', 'import sys; print(sys.executable)'),
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True
+        )
+    except FileNotFoundError:
+        return False
+    return completed_process.returncode == 0 and \
+        os.path.realpath(completed_process.stdout.strip()) == os.path.realpath(sys.executable)
+
+
+def execute_in_process(
+        pairs: List[Pair],
+        files_names_suffixes: Union[Tuple[str], List[str]] = None,
+        parallelism: int = None,
+        directory: str = None,
+        timeout: float = None
+) -> Iterator[Tuple[Pair, Dict[str, Any]]]:
+    """
+    Executes xxxt files within the current process if their interpreter is the current one,
+    other pairs are executed by execute_serially.
+    Executions are not isolated: they share imported modules and the process state with the harness.
+
+    :param pairs: a list of tuples like (interpreter's executable name, xxxt file's name).
+    :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param parallelism: ignored, accepted for a compatibility with other backends.
+    :param directory: the directory in which files are executed, the engine's setting is used if it is None.
+    :param timeout: ignored, accepted for a compatibility with other backends.
+    :return: an iterator of tuples like (pair, a result of its execution) in order of completion.
+    """
+    if directory is None:
+        directory = settings()['CURRENT_WORKING_DIRECTORY']
+    for pair in pairs:
+        if is_current_interpreter(pair[0]):
+            check_execution_arguments(pair[1], pair[0], files_names_suffixes)
+            status, output = xxxt.core.worker.run_xxxt_file(pair[1], directory)
+            yield pair, {'status': status, 'output': output.encode()}
+        else:
+            yield from execute_serially([pair], files_names_suffixes, directory=directory)
+
+
+EXECUTION_BACKENDS = {
+    'serial': execute_serially,
+    'parallel': execute_in_parallel,
+    'warm': execute_with_warm_workers,
+    'inprocess': execute_in_process,
+}
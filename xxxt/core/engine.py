@@ -1,7 +1,9 @@
 import sysconfig
 import os
+import hashlib
 import subprocess
-from typing import Union, Tuple, List, Any, Callable, Dict
+from types import MappingProxyType
+from typing import Union, Tuple, List, Any, Callable, Dict, Iterator, Mapping
 
 __SETTINGS = {
     'PLATFORM': sysconfig.get_platform(),
@@ -10,17 +12,43 @@ __SETTINGS = {
     'XXXT_FILES_NAMES_SUFFIXES': ['spd', ],
     'XXXT_FILES_NAMES_SUFFIXES_ONLY_FOR_THIRD_PYTHON_IMPLEMENTATIONS': ['mmr', ],
     'PRINT_EXECUTION_RESULT_ON_CONSOLE': True,
+    'EXECUTION_BACKEND': 'serial',
+    'EXECUTION_PARALLELISM': os.cpu_count() or 1,
+    'EXECUTION_TIMEOUT': None,
 }
 
 
-def settings() -> dict:
+__SETTINGS_SNAPSHOT = None
+
+
+def freeze(value: Any) -> Any:
+    """
+    Makes an immutable counterpart of a value: dictionaries become read-only mappings, lists become tuples
+    and sets become frozen sets, all of them recursively.
+
+    :param value: the value to be frozen.
+    :return: the frozen value.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+def settings() -> Mapping[str, Any]:
     """
-    Makes and returns a deep copy of a settings dictionary.
+    Returns an immutable snapshot of a settings dictionary.
+    The snapshot is shared between calls and is rebuilt only after the settings dictionary was changed.
     
-    :return: the deep copy of the settings dictionary.
+    :return: the immutable snapshot of the settings dictionary.
     """
-    from copy import deepcopy
-    return deepcopy(__SETTINGS)
+    global __SETTINGS_SNAPSHOT
+    if __SETTINGS_SNAPSHOT is None:
+        __SETTINGS_SNAPSHOT = freeze(__SETTINGS)
+    return __SETTINGS_SNAPSHOT
 
 
 def set_setting(name: str, value: Any, target: dict = None) -> bool:
@@ -32,23 +60,27 @@ def set_setting(name: str, value: Any, target: dict = None) -> bool:
     :param target: a dictionary which contains settings.
     :return: True if setting was set, False otherwise.
     """
+    global __SETTINGS_SNAPSHOT
     if target is None:
         target = __SETTINGS
     if not isinstance(target, dict):
         raise TypeError("target must be a dictionary, not {}".format(target.__class__.__name__))
     if name in target and value is not None and value != '':
         target[name] = value
+        if target is __SETTINGS:
+            __SETTINGS_SNAPSHOT = None
         return True
     return False
 
 
-def populate_settings_with_file(filename: str = 'settings.py', directory: str = None) -> None:
+def read_settings_file(filename: str = 'settings.py', directory: str = None) -> Dict[str, Any]:
     """
-    Populates __SETTINGS dictionary with pairs defined in a file with a name filename within a directory.
-    
+    Reads settings defined in a file with a name filename within a directory without applying them.
+    Only names which are present in __SETTINGS dictionary and values which set_setting would accept are read.
+
     :param filename: the name of the file with settings.
     :param directory: the directory in which the file is located.
-    :return: None.
+    :return: a dictionary with read settings.
     """
     if directory is None:
         directory = __SETTINGS['CURRENT_WORKING_DIRECTORY']
@@ -62,14 +94,28 @@ def populate_settings_with_file(filename: str = 'settings.py', directory: str =
         raise ValueError("directory's value can't be an empty string!")
     if not filename.endswith('.py'):
         raise ValueError("file with name 'filename' is not a python module!")
-    if filename in os.listdir(directory):
-        from importlib import import_module
-        settings_module = import_module(filename.replace('.py', ''), directory)
-        for setting_name in __SETTINGS:
-            if hasattr(settings_module, setting_name):
-                set_setting(setting_name, getattr(settings_module, setting_name))
-    else:
+    if filename not in os.listdir(directory):
         raise FileNotFoundError("File with a name 'filename' was not found in directory 'directory'")
+    from importlib.util import spec_from_file_location, module_from_spec
+    settings_module_spec = spec_from_file_location(filename[:-len('.py')], os.path.join(directory, filename))
+    settings_module = module_from_spec(settings_module_spec)
+    settings_module_spec.loader.exec_module(settings_module)
+    return {
+        setting_name: getattr(settings_module, setting_name) for setting_name in __SETTINGS
+        if getattr(settings_module, setting_name, None) not in (None, '')
+    }
+
+
+def populate_settings_with_file(filename: str = 'settings.py', directory: str = None) -> None:
+    """
+    Populates __SETTINGS dictionary with pairs defined in a file with a name filename within a directory.
+    
+    :param filename: the name of the file with settings.
+    :param directory: the directory in which the file is located.
+    :return: None.
+    """
+    for setting_name, setting_value in read_settings_file(filename, directory).items():
+        set_setting(setting_name, setting_value)
 
 
 def explore_dir_for_files(
@@ -110,15 +156,139 @@ def explore_dir_for_files(
     ]
 
 
-def execute(xxxt_filename: str, interpreter_exec_name: str,
-            files_names_suffixes: Union[Tuple[str], List[str]] = None) -> Dict[str, Any]:
+def select_files(
+        xxxt_filenames: Union[Tuple[str], List[str]],
+        names: Union[Tuple[str], List[str]] = None,
+        globs: Union[Tuple[str], List[str]] = None,
+        regexes: Union[Tuple[str], List[str]] = None
+) -> List[str]:
     """
-    Executes a xxxt file with a given interpreter's executable name.
-    
+    Selects files whose names are equal to any of given names, match any of given glob patterns
+    or are searched by any of given regular expressions. If no selectors are given all files are selected.
+
+    :param xxxt_filenames: a list with xxxt filenames.
+    :param names: a list of exact files names.
+    :param globs: a list of glob patterns like 'list_*_spdt.py'.
+    :param regexes: a list of regular expressions which are searched in files names.
+    :return: a list of selected files in their original order.
+    """
+    from fnmatch import fnmatchcase
+    import re
+    if not isinstance(xxxt_filenames, (tuple, list)):
+        raise TypeError("xxxt_filenames argument must be a tuple of strings or a list of strings, not {}".format(
+            xxxt_filenames.__class__.__name__
+        ))
+    for selectors in (names, globs, regexes):
+        if selectors is not None and not isinstance(selectors, (tuple, list)):
+            raise TypeError("names, globs and regexes arguments must be tuples of strings or lists of strings")
+    if not names and not globs and not regexes:
+        return list(xxxt_filenames)
+    names = set(names or ())
+    compiled_regexes = [re.compile(regex) for regex in regexes or ()]
+    return [
+        xxxt_filename for xxxt_filename in xxxt_filenames
+        if xxxt_filename in names or
+        any(fnmatchcase(xxxt_filename, glob) for glob in globs or ()) or
+        any(compiled_regex.search(xxxt_filename) for compiled_regex in compiled_regexes)
+    ]
+
+
+def compute_file_state(
+        xxxt_filename: str,
+        directory: str = None,
+        previous_state: Tuple[int, int, str] = None
+) -> Tuple[int, int, str]:
+    """
+    Computes a state of a xxxt file as a tuple of its modification time in nanoseconds, its size and its content hash.
+    The content hash is reused from previous_state if the modification time and the size are unchanged.
+
+    :param xxxt_filename: a name of the xxxt file.
+    :param directory: the directory in which the file is located.
+    :param previous_state: a previously computed state of the same file.
+    :return: the tuple which describes the file's state.
+    """
+    if directory is None:
+        directory = __SETTINGS['CURRENT_WORKING_DIRECTORY']
+    if not isinstance(xxxt_filename, str):
+        raise TypeError("xxxt_filename argument must be a string, not {}".format(xxxt_filename.__class__.__name__))
+    if not isinstance(directory, str):
+        raise TypeError("directory argument must be a string, not {}".format(directory.__class__.__name__))
+    if previous_state is not None and not isinstance(previous_state, tuple):
+        raise TypeError("previous_state argument must be a tuple, not {}".format(previous_state.__class__.__name__))
+    path = os.path.join(directory, xxxt_filename)
+    stat_result = os.stat(path)
+    if previous_state is not None and previous_state[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+        return previous_state
+    with open(path, 'rb') as xxxt_file:
+        digest = hashlib.sha1(xxxt_file.read()).hexdigest()
+    return stat_result.st_mtime_ns, stat_result.st_size, digest
+
+
+def compute_files_states(
+        xxxt_filenames: Union[Tuple[str], List[str]],
+        directory: str = None,
+        previous_states: Dict[str, Tuple[int, int, str]] = None
+) -> Dict[str, Tuple[int, int, str]]:
+    """
+    Computes states of all xxxt files with names from a given list.
+    Files which disappeared between listing and computing are skipped.
+
+    :param xxxt_filenames: a list with xxxt filenames.
+    :param directory: the directory in which the files are located.
+    :param previous_states: a dictionary with previously computed states of files.
+    :return: a dictionary which maps each xxxt filename to its state.
+    """
+    if not isinstance(xxxt_filenames, (tuple, list)):
+        raise TypeError("xxxt_filenames argument must be a tuple of strings or a list of strings, not {}".format(
+            xxxt_filenames.__class__.__name__
+        ))
+    if previous_states is None:
+        previous_states = {}
+    if not isinstance(previous_states, dict):
+        raise TypeError("previous_states argument must be a dictionary, not {}".format(
+            previous_states.__class__.__name__
+        ))
+    files_states = {}
+    for xxxt_filename in xxxt_filenames:
+        try:
+            files_states[xxxt_filename] = compute_file_state(
+                xxxt_filename, directory, previous_states.get(xxxt_filename)
+            )
+        except FileNotFoundError:
+            pass
+    return files_states
+
+
+def detect_changed_files(
+        previous_states: Dict[str, Tuple[int, int, str]],
+        current_states: Dict[str, Tuple[int, int, str]]
+) -> Tuple[List[str], List[str]]:
+    """
+    Compares two dictionaries of files states by content hashes.
+
+    :param previous_states: a dictionary with previously computed states of files.
+    :param current_states: a dictionary with currently computed states of files.
+    :return: a tuple with a list of changed or added files and a list of removed files.
+    """
+    if not isinstance(previous_states, dict) or not isinstance(current_states, dict):
+        raise TypeError("previous_states and current_states arguments must be dictionaries")
+    changed_files = [
+        xxxt_filename for xxxt_filename, state in current_states.items()
+        if xxxt_filename not in previous_states or previous_states[xxxt_filename][2] != state[2]
+    ]
+    removed_files = [xxxt_filename for xxxt_filename in previous_states if xxxt_filename not in current_states]
+    return changed_files, removed_files
+
+
+def check_execution_arguments(xxxt_filename: str, interpreter_exec_name: str,
+                              files_names_suffixes: Union[Tuple[str], List[str]] = None) -> None:
+    """
+    Checks arguments of a xxxt file's execution and raises an exception if they are wrong.
+
     :param xxxt_filename: a name of the xxxt file.
     :param interpreter_exec_name: interpreter's executable name.
     :param files_names_suffixes: a list of suffixes with which should end each file.
-    :return: a dictionary with a result of execution.
+    :return: None.
     """
     if files_names_suffixes is None:
         files_names_suffixes = __SETTINGS['XXXT_FILES_NAMES_SUFFIXES']
@@ -141,13 +311,33 @@ def execute(xxxt_filename: str, interpreter_exec_name: str,
             break
     else:
         raise ValueError("Not a xxxt file!")
+
+
+def execute(xxxt_filename: str, interpreter_exec_name: str,
+            files_names_suffixes: Union[Tuple[str], List[str]] = None, directory: str = None) -> Dict[str, Any]:
+    """
+    Executes a xxxt file with a given interpreter's executable name.
+    
+    :param xxxt_filename: a name of the xxxt file.
+    :param interpreter_exec_name: interpreter's executable name.
+    :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param directory: the directory in which the file is executed, __SETTINGS['CURRENT_WORKING_DIRECTORY'] value is
+    used if it is None.
+    :return: a dictionary with a result of execution.
+    """
+    if directory is None:
+        directory = __SETTINGS['CURRENT_WORKING_DIRECTORY']
+    check_execution_arguments(xxxt_filename, interpreter_exec_name, files_names_suffixes)
+    if not isinstance(directory, str):
+        raise TypeError("directory argument must be a string, not {}".format(directory.__class__.__name__))
     execution_result = {
         'status': "FAILURE",
         'output': b"Interpreter's executable not found!"
     }
     try:
         completed_process = subprocess.run(
-            (interpreter_exec_name, xxxt_filename), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            (interpreter_exec_name, xxxt_filename),
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=directory
         )
         execution_result.update({
             'status': 'SUCCESS' if not completed_process.returncode else 'FAILURE',
@@ -159,28 +349,90 @@ def execute(xxxt_filename: str, interpreter_exec_name: str,
 
 
 def execute_all(xxxt_filenames: Union[Tuple[str], List[str]], interpreter_exec_name: str,
-                files_names_suffixes: Union[Tuple[str], List[str]] = None) -> Dict[str, Dict[str, Any]]:
+                files_names_suffixes: Union[Tuple[str], List[str]] = None,
+                directory: str = None) -> Dict[str, Dict[str, Any]]:
     """
     Executes all xxxt files with names from a given list for a given interpreter.
     
     :param xxxt_filenames: a list with xxxt filenames.
     :param interpreter_exec_name: name of interpreter's executable.
     :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param directory: the directory in which files are executed, see execute.
     :return: a dictionary which describes a status of execution for each xxxt file.
     """
     if not isinstance(xxxt_filenames, (tuple, list)):
         raise TypeError("xxxt_files argument must be a tuple of strings or a list of strings, not {}".format(
             xxxt_filenames.__class__.__name__
         ))
-    return {xxxt_filename: execute(xxxt_filename, interpreter_exec_name, files_names_suffixes)
+    return {xxxt_filename: execute(xxxt_filename, interpreter_exec_name, files_names_suffixes, directory)
             for xxxt_filename in xxxt_filenames}
 
 
+def iterate_executions(
+        pairs: List[Tuple[str, str]],
+        files_names_suffixes: Union[Tuple[str], List[str]] = None,
+        backend: str = None,
+        parallelism: int = None,
+        directory: str = None,
+        timeout: float = None
+) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Executes xxxt files with their interpreters by one backend's call
+    and yields each execution's result as soon as it is ready.
+
+    :param pairs: a list of tuples like (interpreter's executable name, xxxt file's name).
+    :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param backend: a name of an execution backend from xxxt.core.backends.EXECUTION_BACKENDS,
+    __SETTINGS['EXECUTION_BACKEND'] value is used if it is None.
+    :param parallelism: a degree of parallelism for the backend, __SETTINGS['EXECUTION_PARALLELISM'] value is used if
+    it is None.
+    :param directory: the directory in which files are executed, __SETTINGS['CURRENT_WORKING_DIRECTORY'] value is
+    used if it is None.
+    :param timeout: seconds which a backend may wait for one execution, see xxxt.core.backends,
+    __SETTINGS['EXECUTION_TIMEOUT'] value is used if it is None and its None value means no timeout.
+    :return: an iterator of tuples like (interpreter's executable name, xxxt file's name, xxxt file execution result)
+    in order of completion.
+    """
+    from xxxt.core.backends import EXECUTION_BACKENDS
+    if backend is None:
+        backend = __SETTINGS['EXECUTION_BACKEND']
+    if parallelism is None:
+        parallelism = __SETTINGS['EXECUTION_PARALLELISM']
+    if directory is None:
+        directory = __SETTINGS['CURRENT_WORKING_DIRECTORY']
+    if timeout is None:
+        timeout = __SETTINGS['EXECUTION_TIMEOUT']
+    if not isinstance(pairs, (tuple, list)):
+        raise TypeError("pairs argument must be a tuple of tuples or a list of tuples, not {}".format(
+            pairs.__class__.__name__
+        ))
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError("backend's value must be one of {}".format(', '.join(EXECUTION_BACKENDS)))
+    if not isinstance(parallelism, int):
+        raise TypeError("parallelism must be an integer, not {}".format(parallelism.__class__.__name__))
+    if parallelism < 1:
+        raise ValueError("parallelism's value must be greater then 0")
+    if not isinstance(directory, str):
+        raise TypeError("directory argument must be a string, not {}".format(directory.__class__.__name__))
+    if timeout is not None and not isinstance(timeout, (int, float)):
+        raise TypeError("timeout must be a number, not {}".format(timeout.__class__.__name__))
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout's value must be greater then 0")
+    for (interpreter_exec_name, xxxt_filename), xxxt_file_execution_result in EXECUTION_BACKENDS[backend](
+            pairs, files_names_suffixes, parallelism, os.path.abspath(directory), timeout
+    ):
+        yield interpreter_exec_name, xxxt_filename, xxxt_file_execution_result
+
+
 def execute_all_for_all(
         xxxt_filenames: List[str],
         interpreters_execs_names: Union[Tuple[str], List[str]] = None,
         only_for_third_python_implementations = False,
-        files_names_suffixes: Union[Tuple[str], List[str]] = None
+        files_names_suffixes: Union[Tuple[str], List[str]] = None,
+        backend: str = None,
+        parallelism: int = None,
+        directory: str = None,
+        timeout: float = None
 ) -> Dict[str, Dict[str, Dict[str, Any]]]:
     """
     Executes all xxxt files with names from a given list for all available interpreters.
@@ -191,21 +443,39 @@ def execute_all_for_all(
     __SETTINGS['XXXT_FILES_NAMES_SUFFIXES_ONLY_FOR_THIRD_PYTHON_IMPLEMENTATIONS'] value will be used as a 
     files_names_suffixes value and only implementations of third python will be used for an execution.
     :param files_names_suffixes: a list of suffixes with which should end each file.
+    :param backend: a name of an execution backend, see iterate_executions.
+    :param parallelism: a degree of parallelism for the backend, see iterate_executions.
+    :param directory: the directory in which files are executed, see iterate_executions.
+    :param timeout: seconds which a backend may wait for one execution, see iterate_executions.
     :return: a list of dictionaries which describes a status of execution xxxt files for each available interpreter.
     """
     if interpreters_execs_names is None:
         interpreters_execs_names = __SETTINGS['AVAILABLE_INTERPRETERS_EXECUTABLES_NAMES']
+    if not isinstance(xxxt_filenames, (tuple, list)):
+        raise TypeError("xxxt_files argument must be a tuple of strings or a list of strings, not {}".format(
+            xxxt_filenames.__class__.__name__
+        ))
     if not isinstance(interpreters_execs_names, (tuple, list)):
         raise TypeError("interpreters_execs_names argument must be a tuple of strings or list of strings, not {}".
                         format(interpreters_execs_names.__class__.__name__))
     if only_for_third_python_implementations:
-        interpreters_execs_names = filter(
-            lambda interpreter_exec_name: interpreter_exec_name.find('3') != -1,
-            interpreters_execs_names
-        )
+        interpreters_execs_names = [
+            interpreter_exec_name for interpreter_exec_name in interpreters_execs_names
+            if interpreter_exec_name.find('3') != -1
+        ]
         files_names_suffixes = __SETTINGS['XXXT_FILES_NAMES_SUFFIXES_ONLY_FOR_THIRD_PYTHON_IMPLEMENTATIONS']
+    results = {
+        (interpreter_exec_name, xxxt_filename): xxxt_file_execution_result
+        for interpreter_exec_name, xxxt_filename, xxxt_file_execution_result in iterate_executions([
+            (interpreter_exec_name, xxxt_filename)
+            for interpreter_exec_name in interpreters_execs_names
+            for xxxt_filename in xxxt_filenames
+        ], files_names_suffixes, backend, parallelism, directory, timeout)
+    }
     return {
-        interpreter_exec_name: execute_all(xxxt_filenames, interpreter_exec_name, files_names_suffixes)
+        interpreter_exec_name: {
+            xxxt_filename: results[(interpreter_exec_name, xxxt_filename)] for xxxt_filename in xxxt_filenames
+        }
         for interpreter_exec_name in interpreters_execs_names
     }
 
@@ -231,17 +501,18 @@ def process_all(
         xxxt_files_executions_results: Dict[str, Dict[str, Any]],
         xxxt_filename_callback: Callable[[str], Any],
         process_callback: Callable[[Dict[str, Dict[str, Any]]], Any],
-        process_results_callback: Callable[[List[Tuple[Any, Any]]], Any]
+        process_results_callback: Callable[[Iterator[Tuple[Any, Any]]], Any]
 ) -> Any:
     """
-    Applies a callback to each xxxt file execution result in a given dictionary and produces a list of calls results.
-    Applies to the list of calls results all_callback and returns it's return value.
+    Lazily applies a callback to each xxxt file execution result in a given dictionary and produces an iterator of
+    calls results. Applies to the iterator of calls results process_results_callback and returns it's return value.
+    Callbacks are applied only while process_results_callback consumes the iterator, so no intermediate list is built.
     
     :param xxxt_files_executions_results: the dictionary with data of xxxt files executions results.
     :param xxxt_filename_callback: a callable object which will be applied to each xxxt file's name.
     :param process_callback: a callable object which will be applied to each xxxt file execution result.
-    :param process_results_callback: a callable object which will be applied to the list of process_callback's calls 
-    results.
+    :param process_results_callback: a callable object which will be applied to the iterator of process_callback's 
+    calls results.
     :return: process_results_callback's call result.
     """
     if not isinstance(xxxt_files_executions_results, dict):
@@ -251,11 +522,11 @@ def process_all(
     if not callable(xxxt_filename_callback):
         raise ValueError("xxxt_filename_callback's value must be a callable object like (str) -> any")
     if not callable(process_results_callback):
-        raise ValueError("process_results_callback's value must be a callable object like (list) -> any")
-    return process_results_callback([
+        raise ValueError("process_results_callback's value must be a callable object like (iterator) -> any")
+    return process_results_callback(
         (xxxt_filename_callback(xxxt_filename), process(xxxt_files_executions_results[xxxt_filename], process_callback))
         for xxxt_filename in xxxt_files_executions_results
-    ])
+    )
 
 
 def process_all_for_all(
@@ -263,22 +534,22 @@ def process_all_for_all(
         interpreter_exec_name_callback: Callable[[str], Any],
         xxxt_filename_callback: Callable[[str], Any],
         process_callback: Callable[[Dict[str, Any]], Any],
-        process_results_callback: Callable[[List[Tuple[Any, Any]]], Any],
-        process_all_results_callback: Callable[[List[Tuple[Any, Any]]], Any]
+        process_results_callback: Callable[[Iterator[Tuple[Any, Any]]], Any],
+        process_all_results_callback: Callable[[Iterator[Tuple[Any, Any]]], Any]
 ) -> Any:
     """
-    Applies a callback to each xxxt file execution result in a given dictionary and produces a list of calls results.
-    Produces a list by applying to the each list of calls results all_callback.
-    Then applies to that list for_all_callback and returns it's return value.
+    Lazily applies a callback to each xxxt file execution result in a given dictionary and produces an iterator of 
+    calls results. Produces an iterator by applying to the each iterator of calls results process_results_callback.
+    Then applies to that iterator process_all_results_callback and returns it's return value.
     
     :param executions_results_for_each_interpreter: a dictionary with data of executions results for each interpreter.
     :param interpreter_exec_name_callback: a callable object which will be applied to each interpreter's exe name.
     :param xxxt_filename_callback: a callable object which will be applied to each xxxt file's name.
     :param process_callback: a callable object which will be applied to each xxxt file execution result.
-    :param process_results_callback: a callable object which will be applied to the list of process_callback's calls 
-    results.
-    :param process_all_results_callback: a callable object which will be applied to the list produced by a list 
-    comprehension and process_results_callback's calls.
+    :param process_results_callback: a callable object which will be applied to the iterator of process_callback's 
+    calls results.
+    :param process_all_results_callback: a callable object which will be applied to the iterator produced by a 
+    generator expression and process_results_callback's calls.
     :return: process_all_results_callback's call result.
     """
     if not isinstance(executions_results_for_each_interpreter, dict):
@@ -288,8 +559,8 @@ def process_all_for_all(
     if not callable(interpreter_exec_name_callback):
         raise ValueError("interpreter_exec_name_callback's value must be a callable object like (str) -> any")
     if not callable(process_all_results_callback):
-        raise ValueError("process_all_results_callback's value must be a callable object like (any) -> any")
-    return process_all_results_callback([
+        raise ValueError("process_all_results_callback's value must be a callable object like (iterator) -> any")
+    return process_all_results_callback(
         (
             interpreter_exec_name_callback(interpreter_exec_name),
             process_all(
@@ -300,4 +571,4 @@ def process_all_for_all(
             )
         )
         for interpreter_exec_name in executions_results_for_each_interpreter
-    ])
+    )
@@ -0,0 +1,177 @@
+import sys
+from io import DEFAULT_BUFFER_SIZE
+from typing import Any, Callable, Dict, Iterable, Iterator, TextIO, Tuple, Union
+
+from xxxt.core.utilities import format_interpreter_exec_name_callback, format_xxxt_filename_callback, \
+    format_callback, format_record_label_callback
+
+Record = Tuple[str, Union[str, None], Union[Dict[str, Any], None]]
+
+
+def iterate_executions_results(
+        executions_results_for_each_interpreter: Dict[str, Dict[str, Dict[str, Any]]]
+) -> Iterator[Record]:
+    """
+    Yields records like (interpreter's executable name, xxxt file's name, xxxt file execution result) one at a time.
+    An interpreter without results yields a boundary record like (interpreter's executable name, None, None),
+    so it still gets its header, as with process_all_for_all.
+
+    :param executions_results_for_each_interpreter: a dictionary with data of executions results for each interpreter.
+    :return: an iterator of records.
+    """
+    if not isinstance(executions_results_for_each_interpreter, dict):
+        raise TypeError("executions_results_for_each_interpreter argument must be a dictionary, not {}".format(
+            executions_results_for_each_interpreter.__class__.__name__
+        ))
+    for interpreter_exec_name, xxxt_files_executions_results in executions_results_for_each_interpreter.items():
+        if not xxxt_files_executions_results:
+            yield interpreter_exec_name, None, None
+        for xxxt_filename, xxxt_file_execution_result in xxxt_files_executions_results.items():
+            yield interpreter_exec_name, xxxt_filename, xxxt_file_execution_result
+
+
+def filter_stage(records: Iterable[Record], predicate: Callable[[Record], bool]) -> Iterator[Record]:
+    """
+    Passes through only records for which a predicate is true.
+
+    :param records: an iterable of records.
+    :param predicate: a callable like (record) -> bool.
+    :return: an iterator of passed records.
+    """
+    if not callable(predicate):
+        raise ValueError("predicate's value must be a callable object like (tuple) -> bool")
+    return filter(predicate, records)
+
+
+def transform_stage(records: Iterable[Record], transformer: Callable[[Record], Record]) -> Iterator[Record]:
+    """
+    Applies a transformer to each record.
+
+    :param records: an iterable of records.
+    :param transformer: a callable like (record) -> record.
+    :return: an iterator of transformed records.
+    """
+    if not callable(transformer):
+        raise ValueError("transformer's value must be a callable object like (tuple) -> tuple")
+    return map(transformer, records)
+
+
+def format_stage(
+        records: Iterable[Record],
+        interpreter_exec_name_formatter: Callable[[str], str] = format_interpreter_exec_name_callback,
+        xxxt_filename_formatter: Callable[[str], str] = format_xxxt_filename_callback,
+        execution_result_formatter: Callable[[Dict[str, Any]], str] = format_callback
+) -> Iterator[str]:
+    """
+    Turns records into text chunks. An interpreter's header is yielded each time the interpreter changes.
+    Boundary records, whose xxxt file's name is None, yield only the header.
+    Any formatter may be None, then the corresponding part of a record is not output.
+
+    :param records: an iterable of records.
+    :param interpreter_exec_name_formatter: a callable like (str) -> str for interpreters executables names.
+    :param xxxt_filename_formatter: a callable like (str) -> str for xxxt files names.
+    :param execution_result_formatter: a callable like (dict) -> str for xxxt files executions results.
+    :return: an iterator of text chunks.
+    """
+    previous_interpreter_exec_name = None
+    for interpreter_exec_name, xxxt_filename, xxxt_file_execution_result in records:
+        if interpreter_exec_name_formatter is not None and interpreter_exec_name != previous_interpreter_exec_name:
+            previous_interpreter_exec_name = interpreter_exec_name
+            yield interpreter_exec_name_formatter(interpreter_exec_name)
+        if xxxt_filename is None:
+            continue
+        if xxxt_filename_formatter is not None:
+            yield xxxt_filename_formatter(xxxt_filename)
+        if execution_result_formatter is not None:
+            yield execution_result_formatter(xxxt_file_execution_result)
+
+
+def format_labeled_stage(
+        records: Iterable[Record],
+        record_label_formatter: Callable[[str, str], str] = format_record_label_callback,
+        execution_result_formatter: Callable[[Dict[str, Any]], str] = format_callback
+) -> Iterator[str]:
+    """
+    Turns records into text chunks, each record is labeled with its interpreter's executable name.
+    Unlike format_stage, it doesn't rely on records being grouped by interpreters,
+    so it suits records which come in order of completion. Boundary records are skipped.
+
+    :param records: an iterable of records.
+    :param record_label_formatter: a callable like (str, str) -> str for interpreters executables names
+    and xxxt files names.
+    :param execution_result_formatter: a callable like (dict) -> str for xxxt files executions results.
+    :return: an iterator of text chunks.
+    """
+    for interpreter_exec_name, xxxt_filename, xxxt_file_execution_result in records:
+        if xxxt_filename is None:
+            continue
+        yield record_label_formatter(interpreter_exec_name, xxxt_filename)
+        yield execution_result_formatter(xxxt_file_execution_result)
+
+
+def write_sink(chunks: Iterable[str], stream: TextIO = None, buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """
+    Writes text chunks to a stream in batches of at least buffer_size characters and flushes the stream at the end.
+
+    :param chunks: an iterable of text chunks.
+    :param stream: a text stream, sys.stdout is used if it is None.
+    :param buffer_size: a number of characters collected before a write call.
+    :return: a number of written characters.
+    """
+    if stream is None:
+        stream = sys.stdout
+    if not isinstance(buffer_size, int):
+        raise TypeError("buffer_size must be an integer, not {}".format(buffer_size.__class__.__name__))
+    if buffer_size < 0:
+        raise ValueError("buffer_size's value can't be negative")
+    buffer = []
+    buffered_size = 0
+    written_size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered_size += len(chunk)
+        if buffered_size >= buffer_size:
+            written_size += stream.write(''.join(buffer))
+            buffer.clear()
+            buffered_size = 0
+    if buffer:
+        written_size += stream.write(''.join(buffer))
+    stream.flush()
+    return written_size
+
+
+def run_pipeline(source: Iterable[Any], *stages: Callable[[Iterable[Any]], Iterable[Any]],
+                 sink: Callable[[Iterable[Any]], Any] = write_sink) -> Any:
+    """
+    Chains stages over a source, so items flow through the whole pipeline one at a time, and feeds them to a sink.
+    Stages which need arguments can be configured with functools.partial.
+
+    :param source: an iterable of items, usually produced by iterate_executions_results.
+    :param stages: callables like (iterable) -> iterable which are applied in a given order.
+    :param sink: a callable like (iterable) -> any which consumes the last stage's output.
+    :return: sink's call result.
+    """
+    if not all(callable(stage) for stage in stages):
+        raise ValueError("each stage must be a callable object like (iterable) -> iterable")
+    if not callable(sink):
+        raise ValueError("sink's value must be a callable object like (iterable) -> any")
+    for stage in stages:
+        source = stage(source)
+    return sink(source)
+
+
+def report(executions_results_for_each_interpreter: Dict[str, Dict[str, Dict[str, Any]]],
+           *stages: Callable[[Iterable[Any]], Iterable[Any]], stream: TextIO = None) -> int:
+    """
+    Outputs executions results through given record stages and format_stage into a stream by write_sink.
+
+    :param executions_results_for_each_interpreter: a dictionary with data of executions results for each interpreter.
+    :param stages: callables like (iterable) -> iterable which are applied to records before formatting.
+    :param stream: a text stream, sys.stdout is used if it is None.
+    :return: a number of written characters.
+    """
+    return run_pipeline(
+        iterate_executions_results(executions_results_for_each_interpreter),
+        *stages, format_stage,
+        sink=lambda chunks: write_sink(chunks, stream)
+    )
@@ -1,5 +1,7 @@
 import subprocess
-from typing import Union, Tuple, List, Dict, Any
+from collections import deque
+from difflib import unified_diff
+from typing import Union, Tuple, List, Dict, Any, Iterable
 
 INTERPRETERS_EXECUTABLES_NAMES = (
     'python2',
@@ -67,6 +69,53 @@ def split2list_of_strings(src: Union[bytes, str], sep: Union[bytes, str]= '\n')
     return src.decode().split(sep)
 
 
+def format_callback(xxxt_file_execution_result: Dict[str, Any]) -> str:
+    """
+    Formats xxxt file execution result as a text block for console.
+
+    :param xxxt_file_execution_result: a dictionary with execution result of a xxxt file.
+    :return: the formatted text block.
+    """
+    keys = list(xxxt_file_execution_result.keys())
+    lines = ["{} => {};".format(key, xxxt_file_execution_result[key]) for key in keys[:-1]]
+    lines.append("{}: ".format(keys[-1]))
+    lines.extend(">>> {}".format(line) for line in split2list_of_strings(xxxt_file_execution_result[keys[-1]]))
+    lines.append("\n")
+    return "\n".join(lines)
+
+
+def format_xxxt_filename_callback(xxxt_filename: str) -> str:
+    """
+    Formats xxxt file's name as a line for console.
+
+    :param xxxt_filename: the xxxt file's name.
+    :return: the formatted line.
+    """
+    return "file: '{}';\n".format(xxxt_filename)
+
+
+def format_interpreter_exec_name_callback(interpreter_exec_name: str) -> str:
+    """
+    Formats interpreter's executable name as a header line for console.
+
+    :param interpreter_exec_name: the interpreter's executable name.
+    :return: the formatted line.
+    """
+    sep_line = "#" * 100
+    return "{} {} {}\n".format(sep_line, "interpreter: {}".format(interpreter_exec_name).upper(), sep_line)
+
+
+def format_record_label_callback(interpreter_exec_name: str, xxxt_filename: str) -> str:
+    """
+    Formats interpreter's executable name and xxxt file's name as a label line for console.
+
+    :param interpreter_exec_name: the interpreter's executable name.
+    :param xxxt_filename: the xxxt file's name.
+    :return: the formatted line.
+    """
+    return "interpreter: {}; file: '{}';\n".format(interpreter_exec_name, xxxt_filename)
+
+
 def print_callback(xxxt_file_execution_result: Dict[str, Any]) -> None:
     """
     Prints xxxt file execution result on console.
@@ -74,13 +123,7 @@ def print_callback(xxxt_file_execution_result: Dict[str, Any]) -> None:
     :param xxxt_file_execution_result: a dictionary with execution result of a xxxt file.
     :return: None.
     """
-    keys = list(xxxt_file_execution_result.keys())
-    for key in keys[:-1]:
-        print("{} => {};".format(key, xxxt_file_execution_result[key]))
-    print("{}: ".format(keys[-1]))
-    for line in split2list_of_strings(xxxt_file_execution_result[keys[-1]]):
-        print(">>> {}".format(line))
-    print()
+    print(format_callback(xxxt_file_execution_result), end='')
 
 
 def print_xxxt_filename_callback(xxxt_filename: str) -> None:
@@ -90,7 +133,7 @@ def print_xxxt_filename_callback(xxxt_filename: str) -> None:
     :param xxxt_filename: the xxxt file's name.
     :return: None.
     """
-    print("file: '{}';".format(xxxt_filename))
+    print(format_xxxt_filename_callback(xxxt_filename), end='')
 
 
 def print_interpreter_exec_name_callback(interpreter_exec_name: str) -> None:
@@ -100,17 +143,55 @@ def print_interpreter_exec_name_callback(interpreter_exec_name: str) -> None:
     :param interpreter_exec_name: the interpreter's executable name.
     :return: None.
     """
-    sep_line = "#" * 100
-    print(sep_line, "interpreter: {}".format(interpreter_exec_name).upper(), sep_line)
+    print(format_interpreter_exec_name_callback(interpreter_exec_name), end='')
 
 
-def process_none_results_callback(results_list: List[Tuple[None, None]]) -> None:
+def process_none_results_callback(results: Iterable[Tuple[None, None]]) -> None:
     """
-    Deletes reference on unnecessary list of tuples like (None, None).
+    Consumes an iterable of tuples like (None, None) without keeping references on its items.
     
-    :param results_list: 
+    :param results: the iterable which is produced by process_all or process_all_for_all.
     :return: None.
     """
-    if not isinstance(results_list, list):
-        raise TypeError(" argument must be a list of tuples, not {}".format(results_list.__class__.__name__))
-    del results_list
+    if not hasattr(results, '__iter__'):
+        raise TypeError("results argument must be an iterable of tuples, not {}".format(results.__class__.__name__))
+    deque(results, maxlen=0)
+
+
+def print_delta_callback(
+        interpreter_exec_name: str,
+        xxxt_filename: str,
+        previous_result: Union[Dict[str, Any], None],
+        current_result: Union[Dict[str, Any], None]
+) -> None:
+    """
+    Prints a delta between a previous and a current xxxt file execution results on console.
+
+    :param interpreter_exec_name: the interpreter's executable name.
+    :param xxxt_filename: the xxxt file's name.
+    :param previous_result: a dictionary with previous execution result or None if there was no previous execution.
+    :param current_result: a dictionary with current execution result or None if the file was removed.
+    :return: None.
+    """
+    header = "interpreter: {}; file: '{}';".format(interpreter_exec_name, xxxt_filename)
+    if current_result is None:
+        print("- {} removed;".format(header))
+        return
+    if previous_result is None:
+        print("+ {}".format(header))
+        print_callback(current_result)
+        return
+    if previous_result == current_result:
+        print("= {} no changes;".format(header))
+        return
+    print("~ {}".format(header))
+    for key in current_result:
+        if key != 'output' and previous_result.get(key) != current_result[key]:
+            print("{} => {} -> {};".format(key, previous_result.get(key), current_result[key]))
+    for line in unified_diff(
+            split2list_of_strings(previous_result.get('output', b'')),
+            split2list_of_strings(current_result.get('output', b'')),
+            'previous', 'current', lineterm=''
+    ):
+        print(">>> {}".format(line))
+    print()
@@ -0,0 +1,85 @@
+"""
+A warm worker which executes xxxt files inside one long-living interpreter's process.
+
+The module is also run as a script by any available interpreter, including the second python,
+so it must stay free of annotations and of imports from the xxxt package.
+Each line of the standard input is a JSON object like {"filename": ..., "directory": ...}
+and for each of them one JSON line like {"status": ..., "output": ...} is written to the standard output.
+Both protocol streams are moved to private file descriptors, so xxxt files which read the standard input
+get EOF instead of requests and output of their child processes doesn't break responses.
+"""
+import io
+import json
+import os
+import runpy
+import sys
+import traceback
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    StringIO = io.StringIO
+
+
+def run_xxxt_file(xxxt_filename, directory=None):
+    """
+    Executes a xxxt file as a __main__ module within the current interpreter and captures its output.
+    Modules imported by the file stay cached, which is what makes the next executions cheap.
+    The file gets an empty standard input.
+
+    :param xxxt_filename: a name of the xxxt file.
+    :param directory: the directory which is the current working directory during the execution,
+    the current one is kept if it is None.
+    :return: a tuple with an execution status and a captured output as a string.
+    """
+    saved_directory = os.getcwd()
+    if directory is not None:
+        os.chdir(directory)
+    stdout, stderr = StringIO(), StringIO()
+    saved_stdin, saved_stdout, saved_stderr, saved_argv = sys.stdin, sys.stdout, sys.stderr, sys.argv
+    saved_path_head = sys.path[0] if sys.path else None
+    sys.stdin, sys.stdout, sys.stderr, sys.argv = StringIO(), stdout, stderr, [xxxt_filename]
+    if sys.path:
+        sys.path[0] = os.path.dirname(os.path.abspath(xxxt_filename))
+    status = 'SUCCESS'
+    try:
+        runpy.run_path(xxxt_filename, run_name='__main__')
+    except SystemExit as system_exit:
+        if system_exit.code not in (None, 0):
+            status = 'FAILURE'
+            if not isinstance(system_exit.code, int):
+                stderr.write(str(system_exit.code) + '\n')
+    except BaseException:
+        status = 'FAILURE'
+        traceback.print_exc(file=stderr)
+    finally:
+        sys.stdin, sys.stdout, sys.stderr, sys.argv = saved_stdin, saved_stdout, saved_stderr, saved_argv
+        if sys.path:
+            sys.path[0] = saved_path_head
+        os.chdir(saved_directory)
+    return status, (stdout if status == 'SUCCESS' else stderr).getvalue()
+
+
+def serve(input_stream, output_stream):
+    """
+    Reads xxxt files names from an input stream and writes executions results to an output stream until EOF.
+
+    :param input_stream: a stream with JSON requests, one per line.
+    :param output_stream: a stream for JSON responses, one per line.
+    :return: None.
+    """
+    for line in iter(input_stream.readline, ''):
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        status, output = run_xxxt_file(request['filename'], request.get('directory'))
+        output_stream.write(json.dumps({'status': status, 'output': output}) + '\n')
+        output_stream.flush()
+
+
+if __name__ == '__main__':
+    protocol_input_stream = os.fdopen(os.dup(sys.stdin.fileno()), 'r')
+    os.dup2(os.open(os.devnull, os.O_RDONLY), sys.stdin.fileno())
+    protocol_output_stream = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    serve(protocol_input_stream, protocol_output_stream)
@@ -1,6 +1,6 @@
 from operator import add
 
-from xxxt.utils.forpy3only.mmrtutils import compr_tracemalloc_snapshots, prepare_for_passing, \
+from xxxt.utils.forpy3only.mmrtutils import compr_tracemalloc_snapshots, compr_memory_timeline, prepare_for_passing, \
     prepare_for_passing_without_kwargs
 
 
@@ -25,3 +25,5 @@ compr_tracemalloc_snapshots(prepare_for_passing_without_kwargs(create_tuple_of_i
 compr_tracemalloc_snapshots(create_1000_ints)
 
 compr_tracemalloc_snapshots(prepare_for_passing_without_kwargs(add, 100, 205))
+
+compr_memory_timeline(prepare_for_passing_without_kwargs(create_ints, 100000), top_allocations=1)
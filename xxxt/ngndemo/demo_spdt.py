@@ -1,6 +1,6 @@
 import timeit
 
-from xxxt.utils.common.spdtutils import compr_timeit_difference
+from xxxt.utils.common.spdtutils import compr_timeit_difference, compr_per_op_difference
 
 compr_timeit_difference(
     "25 + 352", "op.add(25, 352)",
@@ -11,3 +11,7 @@ compr_timeit_difference(
 compr_timeit_difference('258 ** 2', '258 * 258')
 
 compr_timeit_difference('258 ** 3', '258 * 258 * 258')
+
+compr_per_op_difference('258 ** 2', '258 * 258', number=100000, unroll=10)
+
+compr_per_op_difference('x ** 2', 'x * x', setup_for_sec='x = 258', setup_for_first='x = 258', number=100000, unroll=10)
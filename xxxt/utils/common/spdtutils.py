@@ -1,4 +1,6 @@
+import dis
 import timeit
+import warnings
 
 
 def compute_timeit_difference(
@@ -6,7 +8,8 @@ def compute_timeit_difference(
         setup_for_sec='pass', setup_for_first='pass',
         stmts_executor=timeit.timeit,
         times_to_repeat=10,
-        return_full=True
+        return_full=True,
+        number=timeit.default_number
 ):
     """
     Computes a difference between a pair of stmt_executor calls for a pair of statements.
@@ -20,6 +23,7 @@ def compute_timeit_difference(
     :param stmts_executor: a callable object that will be used for executing the pair statements.
     :param times_to_repeat: if stmt_executor's value is timeit.repeat then this will be passed to its repeat parameter.
     :param return_full: a boolean flag that indicates to return full result or not.
+    :param number: how many times each statement is executed by a stmt_executor call.
     :return: depends on ret_full argument's value. If it is True then returns a tuple else a float.
     """
     if not isinstance(first_stmt, str) or not isinstance(sec_stmt, str) or \
@@ -33,12 +37,16 @@ def compute_timeit_difference(
         raise TypeError("times_to_repeat must be an integer, not {}".format(times_to_repeat.__class__.__name__))
     if times_to_repeat < 0:
         raise ValueError("times_to_repeat's value must be greater then 0")
+    if not isinstance(number, int):
+        raise TypeError("number must be an integer, not {}".format(number.__class__.__name__))
+    if number < 1:
+        raise ValueError("number's value must be greater then 0")
     if stmts_executor == timeit.repeat:
-        result_for_first = min(stmts_executor(first_stmt, setup_for_first, repeat=times_to_repeat))
-        result_for_second = min(stmts_executor(sec_stmt, setup_for_sec, repeat=times_to_repeat))
+        result_for_first = min(stmts_executor(first_stmt, setup_for_first, repeat=times_to_repeat, number=number))
+        result_for_second = min(stmts_executor(sec_stmt, setup_for_sec, repeat=times_to_repeat, number=number))
     else:
-        result_for_first = stmts_executor(first_stmt, setup_for_first)
-        result_for_second = stmts_executor(sec_stmt, setup_for_sec)
+        result_for_first = stmts_executor(first_stmt, setup_for_first, number=number)
+        result_for_second = stmts_executor(sec_stmt, setup_for_sec, number=number)
     difference = result_for_second - result_for_first
     return (result_for_first, result_for_second, difference) if return_full else difference
 
@@ -48,7 +56,8 @@ def compr_timeit_difference(
         setup_for_sec='pass', setup_for_first='pass',
         stmts_executor=timeit.timeit,
         times_to_repeat=10,
-        return_full=True
+        return_full=True,
+        number=timeit.default_number
 ):
     """
     Computes and prints a difference between a pair of stmt_executor calls for a pair of statements.
@@ -62,10 +71,11 @@ def compr_timeit_difference(
     :param stmts_executor: a callable object that will be used for executing the pair statements.
     :param times_to_repeat: if stmt_executor's value is timeit.repeat then this will be passed to its repeat parameter.
     :param return_full: a boolean flag that indicates to return full result or not.
+    :param number: how many times each statement is executed by a stmt_executor call.
     :return: depends on ret_full argument's value. If it is True then returns a tuple else a float.
     """
     diff_value = compute_timeit_difference(
-        first_stmt, sec_stmt, setup_for_sec, setup_for_first, stmts_executor, times_to_repeat, return_full
+        first_stmt, sec_stmt, setup_for_sec, setup_for_first, stmts_executor, times_to_repeat, return_full, number
     )
     if isinstance(diff_value, tuple):
         format_pattern = "{}'s call with {} value: {}".format(stmts_executor.__name__, "'{}'", "{}")
@@ -81,6 +91,153 @@ def compr_timeit_difference(
           )
 
 
+CONSTANT_ONLY_OPNAMES = frozenset([
+    'CACHE', 'EXTENDED_ARG', 'LOAD_CONST', 'NOP', 'POP_TOP', 'RESUME', 'RETURN_CONST', 'RETURN_VALUE',
+])
+
+
+def iterate_opnames(code):
+    """
+    Iterates over names of operations of a code object.
+    Works on interpreters without dis.get_instructions by decoding the second python's bytecode.
+
+    :param code: the code object.
+    :return: an iterator of operations names.
+    """
+    if hasattr(dis, 'get_instructions'):
+        for instruction in dis.get_instructions(code):
+            yield instruction.opname
+        return
+    co_code = code.co_code
+    index = 0
+    while index < len(co_code):
+        opcode = ord(co_code[index])
+        yield dis.opname[opcode]
+        index += 3 if opcode >= dis.HAVE_ARGUMENT else 1
+
+
+def is_folded_constant(stmt):
+    """
+    Checks if a statement is compiled to loading of constants and the code object's epilogue only,
+    like '258 ** 2' which the compiler folds to 66564. Timing of such statement measures nothing but a loop overhead.
+    Statements which store a constant, like 'x = 258', are not folded constants, because the store is measured.
+
+    :param stmt: the statement.
+    :return: True if the statement is a folded constant, False otherwise.
+    """
+    if not isinstance(stmt, str):
+        raise TypeError("stmt must be a string, not {}".format(stmt.__class__.__name__))
+    return set(iterate_opnames(compile(stmt, '<stmt>', 'exec'))) <= CONSTANT_ONLY_OPNAMES
+
+
+def compute_timeit_per_op(stmt, setup='pass', times_to_repeat=5, number=timeit.default_number, unroll=1):
+    """
+    Computes how many nanoseconds a single execution of a statement takes.
+    The statement is unrolled unroll times within each loop iteration to amortize a loop cost,
+    and timing of an empty statement with the same setup and number is subtracted as a loop overhead.
+    Both are timed alternately times_to_repeat times and the minimums are taken.
+    Warns with RuntimeWarning if the statement is a folded constant.
+
+    :param stmt: the statement.
+    :param setup: a setup for the statement.
+    :param times_to_repeat: how many times timings are repeated.
+    :param number: a number of loop iterations for each timing.
+    :param unroll: how many copies of the statement are executed within each loop iteration.
+    :return: nanoseconds per operation.
+    """
+    if not isinstance(stmt, str) or not isinstance(setup, str):
+        raise TypeError("statement and setup must be strings")
+    for name, value in (('times_to_repeat', times_to_repeat), ('number', number), ('unroll', unroll)):
+        if not isinstance(value, int):
+            raise TypeError("{} must be an integer, not {}".format(name, value.__class__.__name__))
+        if value < 1:
+            raise ValueError("{}'s value must be greater then 0".format(name))
+    if is_folded_constant(stmt):
+        warnings.warn(
+            "'{}' is compiled to a constant, its timing measures only a loop overhead".format(stmt),
+            RuntimeWarning, stacklevel=2
+        )
+    empty_timer = timeit.Timer('pass', setup)
+    stmt_timer = timeit.Timer('\n'.join([stmt] * unroll), setup)
+    empty_timings = []
+    stmt_timings = []
+    for _ in range(times_to_repeat):
+        empty_timings.append(empty_timer.timeit(number))
+        stmt_timings.append(stmt_timer.timeit(number))
+    return (min(stmt_timings) - min(empty_timings)) / (number * unroll) * 1e9
+
+
+def compute_per_op_difference(
+        first_stmt, sec_stmt,
+        setup_for_sec='pass', setup_for_first='pass',
+        times_to_repeat=5,
+        return_full=True,
+        number=timeit.default_number,
+        unroll=1
+):
+    """
+    Computes a difference between nanoseconds per operation of a pair of statements, see compute_timeit_per_op.
+    May return a tuple with nanoseconds per operation of both statements and a difference if return_full is True
+    else return only the difference.
+
+    :param first_stmt: the first statement from the pair.
+    :param sec_stmt: the second statement from the pair.
+    :param setup_for_sec: a setup for second statement.
+    :param setup_for_first: a setup for first statement.
+    :param times_to_repeat: how many times timings are repeated.
+    :param return_full: a boolean flag that indicates to return full result or not.
+    :param number: a number of loop iterations for each timing.
+    :param unroll: how many copies of a statement are executed within each loop iteration.
+    :return: depends on ret_full argument's value. If it is True then returns a tuple else a float.
+    """
+    result_for_first = compute_timeit_per_op(first_stmt, setup_for_first, times_to_repeat, number, unroll)
+    result_for_second = compute_timeit_per_op(sec_stmt, setup_for_sec, times_to_repeat, number, unroll)
+    difference = result_for_second - result_for_first
+    return (result_for_first, result_for_second, difference) if return_full else difference
+
+
+def compr_per_op_difference(
+        first_stmt, sec_stmt,
+        setup_for_sec='pass', setup_for_first='pass',
+        times_to_repeat=5,
+        return_full=True,
+        number=timeit.default_number,
+        unroll=1
+):
+    """
+    Computes and prints a difference between nanoseconds per operation of a pair of statements,
+    see compute_timeit_per_op. Warnings about folded constants are printed too.
+
+    :param first_stmt: the first statement from the pair.
+    :param sec_stmt: the second statement from the pair.
+    :param setup_for_sec: a setup for second statement.
+    :param setup_for_first: a setup for first statement.
+    :param times_to_repeat: how many times timings are repeated.
+    :param return_full: a boolean flag that indicates to return full result or not.
+    :param number: a number of loop iterations for each timing.
+    :param unroll: how many copies of a statement are executed within each loop iteration.
+    :return: None.
+    """
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter('always', RuntimeWarning)
+        diff_value = compute_per_op_difference(
+            first_stmt, sec_stmt, setup_for_sec, setup_for_first, times_to_repeat, return_full, number, unroll
+        )
+    for caught_warning in caught_warnings:
+        print("Warning: {}".format(caught_warning.message))
+    if isinstance(diff_value, tuple):
+        print("'{}' takes {:.2f} ns per operation".format(first_stmt, diff_value[0]))
+        print("'{}' takes {:.2f} ns per operation".format(sec_stmt, diff_value[1]))
+        diff_value = diff_value[2]
+    print("The value of difference between '{}' and '{}' per operation is: {:.2f} ns".format(
+        first_stmt, sec_stmt, diff_value)
+    )
+    print("'" + sec_stmt + "' is potentially " +
+          ('faster' if diff_value < 0 else 'slower' if diff_value > 0 else 'alternative') +
+          " then '" + first_stmt + "'\n"
+          )
+
+
 class TimeitDifferenceComputationModel(object):
     first_statement = 'pass'
     second_statement = 'pass'
@@ -89,6 +246,8 @@ class TimeitDifferenceComputationModel(object):
     statements_executor = 'timeit'
     times_to_repeat = 10
     return_full_computation_result = True
+    number = timeit.default_number
+    unroll = 1
 
     def __prepare_and_pack_args(self, first_statement, second_statement):
         return (
@@ -98,11 +257,29 @@ class TimeitDifferenceComputationModel(object):
             self.setup4first,
             timeit.repeat if self.statements_executor == 'repeat' else timeit.timeit,
             self.times_to_repeat,
-            self.return_full_computation_result
+            self.return_full_computation_result,
+            self.number
+        )
+
+    def __prepare_and_pack_per_op_args(self, first_statement, second_statement):
+        return (
+            first_statement if first_statement is not None else self.first_statement,
+            second_statement if second_statement is not None else self.second_statement,
+            self.setup4second,
+            self.setup4first,
+            self.times_to_repeat,
+            self.return_full_computation_result,
+            self.number,
+            self.unroll
         )
 
     def compute(self, first_statement=None, second_statement=None):
+        if self.statements_executor == 'per_op':
+            return compute_per_op_difference(*self.__prepare_and_pack_per_op_args(first_statement, second_statement))
         return compute_timeit_difference(*self.__prepare_and_pack_args(first_statement, second_statement))
 
     def comprint(self, first_statement=None, second_statement=None):
+        if self.statements_executor == 'per_op':
+            compr_per_op_difference(*self.__prepare_and_pack_per_op_args(first_statement, second_statement))
+            return
         compr_timeit_difference(*self.__prepare_and_pack_args(first_statement, second_statement))
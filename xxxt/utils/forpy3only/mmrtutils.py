@@ -1,7 +1,17 @@
-import tracemalloc
 import functools
+import json
+import os
+import threading
+import time
+from array import array
+from collections import deque
 from typing import Callable, Any, Union, Tuple, List, Dict
 
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
 
 def wrap(callable_from_stdlib: Callable[[Any], Any]) -> Callable[[Any], Any]:
     """
@@ -15,21 +25,14 @@ def wrap(callable_from_stdlib: Callable[[Any], Any]) -> Callable[[Any], Any]:
     return wrapper
 
 
-def compare_tracemalloc_snapshots(
-        func_leak_mem: Union[Callable[[Any], Any], Tuple[Callable[[Any], Any], Any, Any]],
-        cmp_to_key_type='lineno', cmp_to_cumulative=False
-) -> List[tracemalloc.StatisticDiff]:
+def unpack_func_leak_mem(
+        func_leak_mem: Union[Callable[[Any], Any], Tuple[Callable[[Any], Any], Any, Any]]
+) -> Tuple[Callable[[Any], Any], Tuple[Any, ...], Dict[str, Any]]:
     """
-    Calls a given function and takes two tracemalloc snapshots, a one before and a one after a call, 
-    then compares them and returns a comparison result object.
-    If func_leak_mem is a callable object from the standard library then wraps it by using wrap from this module
-    and uses stats_limit value to slice a comparison result list.
-    
-    :param func_leak_mem: the given function which is leaking memory or 
-    a tuple with the function and positional plus keyword arguments for its call.
-    :param cmp_to_key_type: a key to group comparison statistics.
-    :param cmp_to_cumulative: a comparison cumulative flag.
-    :return: the comparison result list of tracemalloc.StatisticDiff objects.
+    Unpacks a function or a tuple with the function and its arguments as made by prepare_for_passing.
+
+    :param func_leak_mem: the function or the tuple with the function and positional plus keyword arguments.
+    :return: a tuple with the function, its positional arguments and its keyword arguments.
     """
     func_leak_mem_args = tuple()
     func_leak_mem_kwargs = dict()
@@ -47,6 +50,26 @@ def compare_tracemalloc_snapshots(
         func_leak_mem = func_leak_mem[0]
     elif not callable(func_leak_mem):
         raise ValueError("func_leak_mem's value must be a callable object")
+    return func_leak_mem, func_leak_mem_args, func_leak_mem_kwargs
+
+
+def compare_tracemalloc_snapshots(
+        func_leak_mem: Union[Callable[[Any], Any], Tuple[Callable[[Any], Any], Any, Any]],
+        cmp_to_key_type='lineno', cmp_to_cumulative=False
+) -> List['tracemalloc.StatisticDiff']:
+    """
+    Calls a given function and takes two tracemalloc snapshots, a one before and a one after a call, 
+    then compares them and returns a comparison result object.
+    If func_leak_mem is a callable object from the standard library then wraps it by using wrap from this module
+    and uses stats_limit value to slice a comparison result list.
+    
+    :param func_leak_mem: the given function which is leaking memory or 
+    a tuple with the function and positional plus keyword arguments for its call.
+    :param cmp_to_key_type: a key to group comparison statistics.
+    :param cmp_to_cumulative: a comparison cumulative flag.
+    :return: the comparison result list of tracemalloc.StatisticDiff objects.
+    """
+    func_leak_mem, func_leak_mem_args, func_leak_mem_kwargs = unpack_func_leak_mem(func_leak_mem)
     from inspect import getsourcefile
     try:
         srcfile = getsourcefile(func_leak_mem)
@@ -86,6 +109,282 @@ def compr_tracemalloc_snapshots(
         print(stat)
 
 
+def compute_traced_memory_delta(
+        func_leak_mem: Union[Callable[[Any], Any], Tuple[Callable[[Any], Any], Any, Any]]
+) -> Tuple[int, int]:
+    """
+    Calls a given function while tracemalloc is tracing and computes how much traced memory its call result retains
+    and how much traced memory rose at its peak during the call, both relatively to traced memory before the call.
+    Unlike compare_tracemalloc_snapshots, allocations made in any file are counted,
+    so objects created by generated code, like namedtuple's __new__ compiled in '<string>', are included.
+    If tracemalloc was already tracing and has no reset_peak, the peak may come from before the call.
+
+    :param func_leak_mem: the given function or a tuple with the function and positional plus keyword arguments.
+    :return: a tuple with retained and peak sizes in bytes.
+    """
+    func_leak_mem, func_leak_mem_args, func_leak_mem_kwargs = unpack_func_leak_mem(func_leak_mem)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        size_before_call = tracemalloc.get_traced_memory()[0]
+        func_leak_mem_call_result = func_leak_mem(*func_leak_mem_args, **func_leak_mem_kwargs)
+        size_after_call, peak_size = tracemalloc.get_traced_memory()
+        del func_leak_mem_call_result
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return size_after_call - size_before_call, peak_size - size_before_call
+
+
+def compr_traced_memory_delta(
+        func_leak_mem: Union[Callable[[Any], Any], Tuple[Callable[[Any], Any], Any, Any]]
+) -> Tuple[int, int]:
+    """
+    Calls a given function and prints how much traced memory its call result retains and how high it rose.
+
+    :param func_leak_mem: the given function or a tuple with the function and positional plus keyword arguments.
+    :return: a tuple with retained and peak sizes in bytes.
+    """
+    retained_size, peak_size = compute_traced_memory_delta(func_leak_mem)
+    print("retained {} B, peak {} B".format(retained_size, peak_size))
+    return retained_size, peak_size
+
+
+def read_rss() -> int:
+    """
+    Reads a resident set size of the current process.
+    Uses /proc/self/statm where it exists, otherwise falls back to a peak resident set size from resource module.
+
+    :return: the resident set size in bytes.
+    """
+    try:
+        with open('/proc/self/statm') as statm_file:
+            return int(statm_file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        import sys
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class MemoryTimeline(object):
+    """
+    Class that represents a time series of memory usage sampled while a function is running.
+    Times and sizes are kept in arrays, so a sample costs 16 bytes.
+
+    """
+    def __init__(self, source: str, interval: float):
+        """
+        Initializes MemoryTimeline instances.
+
+        :param source: 'tracemalloc' if sizes are traced memory or 'rss' if they are resident set sizes.
+        :param interval: seconds between two samples.
+        """
+        self.source = source
+        self.interval = interval
+        self.times = array('d')
+        self.sizes = array('q')
+        self.peaks = []
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def append(self, sample_time: float, size: int) -> None:
+        """
+        Appends a sample.
+
+        :param sample_time: seconds since the beginning of sampling.
+        :param size: memory size in bytes.
+        :return: None.
+        """
+        self.times.append(sample_time)
+        self.sizes.append(size)
+
+    def peak(self) -> Tuple[float, int]:
+        """
+        Finds the highest sample.
+
+        :return: a tuple with time and size of the highest sample.
+        """
+        if not self.sizes:
+            raise ValueError("timeline has no samples")
+        peak_index = max(range(len(self.sizes)), key=self.sizes.__getitem__)
+        return self.times[peak_index], self.sizes[peak_index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the timeline to a dictionary of plain lists, dictionaries, numbers and strings.
+
+        :return: the dictionary.
+        """
+        return {
+            'source': self.source,
+            'interval': self.interval,
+            'times': self.times.tolist(),
+            'sizes': self.sizes.tolist(),
+            'peaks': [
+                {
+                    'time': peak_time,
+                    'size': peak_size,
+                    'allocations': [{'location': location, 'size': size} for location, size in allocations]
+                }
+                for peak_time, peak_size, allocations in self.peaks
+            ],
+        }
+
+    def to_json(self, **json_dumps_kwargs) -> str:
+        """
+        Converts the timeline to JSON.
+
+        :param json_dumps_kwargs: keyword arguments for json.dumps.
+        :return: the JSON string.
+        """
+        return json.dumps(self.to_dict(), **json_dumps_kwargs)
+
+
+def record_memory_timeline(
+        func_leak_mem: Union[Callable[[Any], Any], Tuple[Callable[[Any], Any], Any, Any]],
+        interval: float = 0.001,
+        top_allocations: int = 5,
+        peak_growth: float = 0.25,
+        use_tracemalloc: bool = True,
+        max_peaks: int = 1,
+        max_overhead: float = 0.1
+) -> MemoryTimeline:
+    """
+    Calls a given function while a background thread samples memory usage each interval seconds.
+    Samples are traced memory if tracemalloc is available and use_tracemalloc is True, resident set sizes otherwise.
+    Each time traced memory exceeds the last captured peak, or the first sample before any peak, by more than
+    peak_growth, a tracemalloc snapshot is taken and top allocation sites are found in it after the call,
+    so it's known what was allocating when memory spiked.
+    Only snapshots of the highest max_peaks peaks are kept, a higher peak replaces the lowest of them.
+    A snapshot pauses the function for a time proportional to a number of traced allocations,
+    so a peak is captured only while snapshots took at most max_overhead of the elapsed time,
+    otherwise it is captured later, when the budget allows it.
+    Traced memory includes 16 bytes per sample of the timeline itself.
+
+    :param func_leak_mem: the given function or a tuple with the function and positional plus keyword arguments.
+    :param interval: seconds between two samples.
+    :param top_allocations: a number of allocation sites captured at a peak, 0 disables capturing.
+    :param peak_growth: a relative growth over the last captured peak which is considered as a new peak.
+    :param use_tracemalloc: a boolean flag that indicates to sample traced memory when it's possible.
+    :param max_peaks: a maximal number of peaks whose snapshots are kept.
+    :param max_overhead: a maximal share of the elapsed time which snapshots may take.
+    :return: the timeline.
+    """
+    func_leak_mem, func_leak_mem_args, func_leak_mem_kwargs = unpack_func_leak_mem(func_leak_mem)
+    if not isinstance(interval, (int, float)):
+        raise TypeError("interval must be a number, not {}".format(interval.__class__.__name__))
+    if interval <= 0:
+        raise ValueError("interval's value must be greater then 0")
+    if not isinstance(top_allocations, int):
+        raise TypeError("top_allocations must be an integer, not {}".format(top_allocations.__class__.__name__))
+    if not isinstance(max_peaks, int):
+        raise TypeError("max_peaks must be an integer, not {}".format(max_peaks.__class__.__name__))
+    if top_allocations < 0 or peak_growth < 0 or max_peaks < 0 or max_overhead < 0:
+        raise ValueError("top_allocations, peak_growth, max_peaks and max_overhead values can't be negative")
+    traced = use_tracemalloc and tracemalloc is not None
+    timeline = MemoryTimeline('tracemalloc' if traced else 'rss', interval)
+    started_tracing = traced and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    read_size = (lambda: tracemalloc.get_traced_memory()[0]) if traced else read_rss
+    stop_event = threading.Event()
+    peaks_snapshots = deque(maxlen=max_peaks)
+    start_time = time.perf_counter()
+
+    def sample() -> None:
+        last_peak_size = timeline.sizes[0]
+        snapshots_seconds = 0.0
+        while not stop_event.wait(interval):
+            size = read_size()
+            sample_time = time.perf_counter() - start_time
+            timeline.append(sample_time, size)
+            if size > last_peak_size * (1 + peak_growth):
+                if traced and top_allocations and max_peaks:
+                    if snapshots_seconds > max_overhead * sample_time:
+                        continue
+                    peaks_snapshots.append((sample_time, size, tracemalloc.take_snapshot()))
+                    snapshots_seconds += time.perf_counter() - start_time - sample_time
+                last_peak_size = size
+
+    timeline.append(0.0, read_size())
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        try:
+            func_leak_mem_call_result = func_leak_mem(*func_leak_mem_args, **func_leak_mem_kwargs)
+        finally:
+            stop_event.set()
+            sampler.join()
+        timeline.append(time.perf_counter() - start_time, read_size())
+        del func_leak_mem_call_result
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    timeline.peaks.extend(
+        (sample_time, size, summarize_top_allocations(snapshot, top_allocations))
+        for sample_time, size, snapshot in peaks_snapshots
+    )
+    return timeline
+
+
+def summarize_top_allocations(snapshot: 'tracemalloc.Snapshot', limit: int) -> List[Tuple[str, int]]:
+    """
+    Finds lines which hold the most of traced memory in a tracemalloc snapshot,
+    allocations made by this module, tracemalloc and threading are ignored.
+    They are skipped among grouped lines instead of being filtered out trace by trace,
+    so the snapshot is walked only once.
+
+    :param snapshot: the tracemalloc snapshot.
+    :param limit: a number of lines to find.
+    :return: a list of tuples like (file:line, size in bytes).
+    """
+    ignored_filenames = {__file__, tracemalloc.__file__, threading.__file__}
+    return [
+        (str(stat.traceback), stat.size) for stat in snapshot.statistics('lineno')
+        if stat.traceback[0].filename not in ignored_filenames
+    ][:limit]
+
+
+def compr_memory_timeline(
+        func_leak_mem: Union[Callable[[Any], Any], Tuple[Callable[[Any], Any], Any, Any]],
+        interval: float = 0.001,
+        top_allocations: int = 5,
+        peak_growth: float = 0.25,
+        use_tracemalloc: bool = True,
+        max_peaks: int = 1,
+        max_overhead: float = 0.1
+) -> MemoryTimeline:
+    """
+    Records a memory timeline of a given function's call and prints its summary with allocation sites at peaks.
+
+    :param func_leak_mem: the given function or a tuple with the function and positional plus keyword arguments.
+    :param interval: seconds between two samples.
+    :param top_allocations: a number of allocation sites captured at a peak, 0 disables capturing.
+    :param peak_growth: a relative growth over the last captured peak which is considered as a new peak.
+    :param use_tracemalloc: a boolean flag that indicates to sample traced memory when it's possible.
+    :param max_peaks: a maximal number of peaks whose allocation sites are printed.
+    :param max_overhead: a maximal share of the elapsed time which snapshots may take.
+    :return: the timeline.
+    """
+    timeline = record_memory_timeline(
+        func_leak_mem, interval, top_allocations, peak_growth, use_tracemalloc, max_peaks, max_overhead
+    )
+    peak_time, peak_size = timeline.peak()
+    print("{} samples of {} memory within {:.4f}s: from {} B to {} B, peak {} B at {:.4f}s".format(
+        len(timeline), timeline.source, timeline.times[-1], timeline.sizes[0], timeline.sizes[-1], peak_size, peak_time
+    ))
+    for sample_time, size, allocations in timeline.peaks:
+        print("peak {} B at {:.4f}s:".format(size, sample_time))
+        for location, allocation_size in allocations:
+            print("    {}: {} B".format(location, allocation_size))
+    return timeline
+
+
 def prepare_for_passing(func: Callable[[Any], Any], *func_args, **func_kwargs) -> Tuple[
     Callable[[Any], Any], Tuple[Any, ...], Dict[str, Any]
 ]: